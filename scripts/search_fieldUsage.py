@@ -4,6 +4,9 @@ import json
 import subprocess
 import sys
 import argparse
+import heapq
+from operator import attrgetter
+import typing
 
 # Try to import pandas - we'll use it for efficient data processing if available
 try:
@@ -19,6 +22,28 @@ DEFAULT_OBJECT = "Account"
 DEFAULT_FIELDS = ["Name", "Industry", "AnnualRevenue"]
 DEFAULT_BATCH_SIZE = 5000
 
+# Parsed command-line arguments, keyed by the argument list they came from
+_parsed_args = {}
+
+class FieldUsage(typing.NamedTuple):
+    """Usage statistics for a single field, as displayed by main"""
+    field: str
+    usage_pct: float
+    non_null_records: int
+    total_records: int
+    is_estimated: bool = False
+
+    @classmethod
+    def from_dict(cls, result):
+        """Build a FieldUsage from a result dictionary returned by analyze_fields"""
+        return cls(
+            result['field'],
+            result['usage_pct'],
+            result['non_null_records'],
+            result['total_records'],
+            result.get('is_estimated', False)
+        )
+
 def run_sfdx_command(command, capture_json=True):
     """Run an SFDX command and return the result"""
     try:
@@ -673,7 +698,7 @@ def get_field_usage(object_name, field_name, total_record_count=None, sample_siz
         print(f"Error calculating field usage: {e}")
         return None
 
-def analyze_fields(object_name, field_names, batch_size=DEFAULT_BATCH_SIZE, use_full_dataset=False):
+def analyze_fields(object_name, field_names, batch_size=DEFAULT_BATCH_SIZE, use_full_dataset=False, use_pandas=True):
     """Analyze usage for multiple fields in a Salesforce object
     
     Args:
@@ -681,6 +706,7 @@ def analyze_fields(object_name, field_names, batch_size=DEFAULT_BATCH_SIZE, use_
         field_names: List of field names to analyze, or comma-separated string
         batch_size: Maximum number of records to query in a batch
         use_full_dataset: If True, analyze the full dataset even if large
+        use_pandas: If False, skip batch processing even if pandas is available
         
     Returns:
         List of dictionaries with field usage data
@@ -697,8 +723,8 @@ def analyze_fields(object_name, field_names, batch_size=DEFAULT_BATCH_SIZE, use_
     total_record_count = get_total_record_count(object_name)
     print(f"Total {object_name} records: {total_record_count}")
     
-    # If pandas is available, use the batch method
-    if HAS_PANDAS and len(field_names) > 1:
+    # If pandas is available (and not disabled by the caller), use the batch method
+    if use_pandas and HAS_PANDAS and len(field_names) > 1:
         print(f"Using batch processing for {len(field_names)} fields")
         return get_field_usage_batch(object_name, field_names, total_record_count, batch_size, use_full_dataset)
     
@@ -712,8 +738,17 @@ def analyze_fields(object_name, field_names, batch_size=DEFAULT_BATCH_SIZE, use_
     
     return results
 
-def parse_args():
-    """Parse command-line arguments"""
+def parse_args(argv=None):
+    """Parse command-line arguments
+    
+    Args:
+        argv: Argument list to parse (default: sys.argv[1:]); the result is
+            cached, so parsing the same arguments again is free
+    """
+    key = tuple(sys.argv[1:] if argv is None else argv)
+    if key in _parsed_args:
+        return _parsed_args[key]
+    
     parser = argparse.ArgumentParser(description='Analyze Salesforce field usage for specific fields')
     parser.add_argument('--object', '-o', type=str, default=DEFAULT_OBJECT,
                         help=f'Salesforce object API name to analyze (default: {DEFAULT_OBJECT})')
@@ -725,66 +760,65 @@ def parse_args():
                         help='Disable batch processing even if pandas is available')
     parser.add_argument('--full-dataset', action='store_true',
                         help='Analyze the full dataset even if large (may take longer)')
-    return parser.parse_args()
+    parser.add_argument('--top', '-t', type=int, default=None,
+                        help='Only list the N most used fields in the sorted results (default: all fields)')
+    _parsed_args[key] = parser.parse_args(list(key))
+    return _parsed_args[key]
 
-def main():
+def main(argv=None):
     try:
         # Parse command-line arguments
-        args = parse_args()
+        args = parse_args(argv)
         
         object_name = args.object
         field_names = args.fields
         batch_size = args.batch_size
         use_full_dataset = args.full_dataset
         
-        # If --no-batch is specified, temporarily disable pandas
-        if args.no_batch:
-            global HAS_PANDAS
-            original_pandas_state = HAS_PANDAS
-            HAS_PANDAS = False
-        
         print(f"Analyzing usage for fields in {object_name}: {', '.join(field_names)}")
         print(f"Using {'complete dataset' if use_full_dataset else f'batches of {batch_size} records'}")
         
         # Analyze field usage
-        results = analyze_fields(object_name, field_names, batch_size, use_full_dataset)
-        
-        # Restore original pandas state if it was changed
-        if args.no_batch:
-            HAS_PANDAS = original_pandas_state
+        results = [
+            FieldUsage.from_dict(result)
+            for result in analyze_fields(object_name, field_names, batch_size, use_full_dataset,
+                                         use_pandas=not args.no_batch)
+        ]
         
-        # Display results
-        print("\nField Usage Results:")
-        print("-" * 80)
-        print(f"{'Field':<30} {'Usage %':<10} {'Non-null Records':<20} {'Total Records':<15}")
-        print("-" * 80)
+        # Display results - rows are collected and written in one call
+        # rather than printed one at a time
+        rows = [
+            "\nField Usage Results:",
+            "-" * 80,
+            f"{'Field':<30} {'Usage %':<10} {'Non-null Records':<20} {'Total Records':<15}",
+            "-" * 80
+        ]
         
         for result in results:
-            field_name = result['field']
-            usage_pct = result['usage_pct']
-            non_null = result['non_null_records']
-            total = result['total_records']
-            estimated = "(estimated)" if result.get('is_estimated', False) else ""
-            
-            print(f"{field_name:<30} {usage_pct:<10.2f} {non_null:<20,d} {total:<15,d} {estimated}")
+            estimated = "(estimated)" if result.is_estimated else ""
+            rows.append(f"{result.field:<30} {result.usage_pct:<10.2f} {result.non_null_records:<20,d} "
+                        f"{result.total_records:<15,d} {estimated}")
         
-        print("-" * 80)
+        rows.append("-" * 80)
         
-        # Sort by usage percentage
-        sorted_results = sorted(results, key=lambda x: x['usage_pct'], reverse=True)
+        # Sort by usage percentage, keeping only the top N fields if requested
+        top_n = args.top if args.top else len(results)
+        sorted_results = heapq.nlargest(top_n, results, key=attrgetter('usage_pct'))
         
         # Show sorted by usage
-        print("\nFields Sorted by Usage Percentage (Highest to Lowest):")
-        print("-" * 80)
-        print(f"{'Field':<30} {'Usage %':<10}")
-        print("-" * 80)
+        if args.top:
+            rows.append(f"\nTop {args.top} Fields by Usage Percentage (Highest to Lowest):")
+        else:
+            rows.append("\nFields Sorted by Usage Percentage (Highest to Lowest):")
+        rows.append("-" * 80)
+        rows.append(f"{'Field':<30} {'Usage %':<10}")
+        rows.append("-" * 80)
         
         for result in sorted_results:
-            field_name = result['field']
-            usage_pct = result['usage_pct']
-            print(f"{field_name:<30} {usage_pct:<10.2f}")
+            rows.append(f"{result.field:<30} {result.usage_pct:<10.2f}")
         
-        print("-" * 80)
+        rows.append("-" * 80)
+        sys.stdout.write("\n".join(rows) + "\n")
         
     except KeyboardInterrupt:
         print("\nProcess interrupted by user. Exiting.")
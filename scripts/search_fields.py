@@ -3,78 +3,191 @@
 import subprocess
 import json
 import argparse
+import re
 import sys
+import shutil
+import tempfile
 import requests
-import difflib
+import collections
+from typing import List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Try to import ijson - we'll use it to stream large describe results if available
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Try to import msgspec - we'll use it to decode describe results into typed structs if available
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+# Try to import rapidfuzz - we'll use it for vectorized fuzzy matching if available
+try:
+    from rapidfuzz import fuzz, process, utils
+    import numpy as np
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
 
 # The minimum similarity score (0-1) required for a fuzzy match
 DEFAULT_SIMILARITY_THRESHOLD = 0.6
 
-def run_sfdx_command(command, capture_json=True):
-    """Run an SFDX command and return the result"""
+# Slack when comparing rapidfuzz's 0-100 scores with threshold * 100, which is
+# not exact (0.55 * 100 is 55.00000000000001) and scores from cdist are float32
+SCORE_EPSILON = 1e-4
+
+# Salesforce REST API version used for describe calls
+API_VERSION = "58.0"
+
+# Maximum number of subrequests Salesforce accepts in one composite request
+COMPOSITE_BATCH_SIZE = 25
+
+# Shared HTTP session so describe calls reuse pooled keep-alive connections
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+))
+
+# Connection details from the one-time auth bootstrap (see get_tooling_api_connection)
+_connection = None
+
+# Field columns already fetched in this process, keyed by object name
+_object_fields_cache = {}
+
+# Parsed command-line arguments, keyed by the argument list they came from
+_parsed_args = {}
+
+# The parts of a describe field that are kept; everything else is dropped when fields are fetched
+Field = collections.namedtuple('Field', 'name label type description object_name')
+
+if HAS_MSGSPEC:
+    class DescribeField(msgspec.Struct):
+        """The subset of a describe field that the search uses; other keys are skipped while decoding"""
+        name: str
+        label: str = ""
+        type: str = ""
+        description: Optional[str] = None
+
+    class DescribeResult(msgspec.Struct):
+        """A describe response, decoded only as far as its fields"""
+        fields: List[DescribeField] = []
+
+def run_sfdx_command(command, capture_json=True, stream=False, stream_prefix='result.fields.item'):
+    """Run an SFDX command and return the result
+    
+    Args:
+        command: SFDX command to execute
+        capture_json: If True, parse the output as JSON
+        stream: If True (and ijson is available), return an iterator over the
+            items found at stream_prefix instead of loading the whole document
+        stream_prefix: ijson prefix of the items to yield when streaming
+    """
+    if stream and HAS_IJSON:
+        return _stream_sfdx_command(command, stream_prefix)
+    
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            check=False,  # Don't raise exception on non-zero return code
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding='utf-8',
-            errors='replace'  # Replace invalid characters instead of failing
-        )
-        
-        if result.returncode != 0:
-            print(f"Error executing command: {command}")
-            print(f"Error: {result.stderr}")
-            return None
+        # Read the pipe directly rather than through subprocess.run, which
+        # collects the output in chunks and then joins and decodes it
+        with tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(
+                command,
+                shell=True,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file  # A file can't fill up and block the process like a second pipe
+            )
+            with proc.stdout:
+                output = proc.stdout.read()
+            proc.wait()
+            
+            if proc.returncode != 0:
+                _print_sfdx_error(command, stderr_file)
+                return None
         
         if capture_json:
             try:
-                return json.loads(result.stdout)
-            except json.JSONDecodeError as e:
+                # json.loads accepts the raw UTF-8 bytes
+                return json.loads(output)
+            except ValueError as e:
                 print(f"Error parsing JSON from command: {command}")
                 print(f"Error details: {str(e)}")
-                print(f"Output (first 1000 chars): {result.stdout[:1000]}")
+                print(f"Output (first 1000 chars): {output[:1000].decode('utf-8', errors='replace')}")
                 return None
         else:
-            return result.stdout
+            return output.decode('utf-8', errors='replace')
     except Exception as e:
         print(f"Error executing command: {command}")
         print(f"Exception: {str(e)}")
         return None
 
-def check_sfdx_installed():
-    """Check if SFDX CLI is installed and authorized"""
+def _print_sfdx_error(command, stderr_file):
+    """Print the error output captured from a failed SFDX command"""
+    stderr_file.seek(0)
+    print(f"Error executing command: {command}")
+    print(f"Error: {stderr_file.read().decode('utf-8', errors='replace')}")
+
+def _stream_sfdx_command(command, prefix):
+    """Run an SFDX command and yield JSON items from its output as they are parsed"""
     try:
-        # Check if SFDX is installed
-        subprocess.run(
-            "sfdx --version",
-            shell=True,
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        # Check if there's an authorized org
-        result = run_sfdx_command("sfdx force:org:display --json")
-        if not result or 'result' not in result:
-            print("No authorized Salesforce org found.")
-            print("Please authorize an org using: sfdx force:auth:web:login")
-            sys.exit(1)
+        with tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(
+                command,
+                shell=True,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file
+            )
+            try:
+                # use_float avoids Decimal values, which json.dumps can't serialize
+                for item in ijson.items(proc.stdout, prefix, use_float=True):
+                    yield item
+            except ijson.JSONError as e:
+                print(f"Error parsing JSON from command: {command}")
+                print(f"Error details: {str(e)}")
+            finally:
+                proc.stdout.close()
+                proc.wait()
             
+            if proc.returncode != 0:
+                _print_sfdx_error(command, stderr_file)
+    except Exception as e:
+        print(f"Error executing command: {command}")
+        print(f"Exception: {str(e)}")
+
+def check_sfdx_installed():
+    """Check if SFDX CLI is installed and authorized
+    
+    This is a one-time bootstrap: the org display call made here also caches
+    the REST connection used by _get_object_field_columns.
+    """
+    if get_tooling_api_connection():
         return True
-    except subprocess.CalledProcessError:
+    
+    if shutil.which('sfdx') is None:
         print("SFDX CLI not found or not properly installed.")
         print("Please install SFDX CLI from: https://developer.salesforce.com/tools/sfdxcli")
         sys.exit(1)
-    except Exception as e:
-        print(f"Error checking SFDX installation: {e}")
-        sys.exit(1)
+    
+    print("No authorized Salesforce org found.")
+    print("Please authorize an org using: sfdx force:auth:web:login")
+    sys.exit(1)
 
 def get_tooling_api_connection():
-    """Get connection information for the Tooling API"""
+    """Get connection information for the Tooling API
+    
+    The org is only displayed once per process; later calls return the cached
+    connection. The access token is also set on the shared HTTP session.
+    """
+    global _connection
+    if _connection is not None:
+        return _connection
+    
     try:
         # Get org authentication details
         auth_result = run_sfdx_command("sfdx force:org:display --json")
@@ -89,11 +202,13 @@ def get_tooling_api_connection():
         if not instance_url or not access_token:
             print("Missing instanceUrl or accessToken in SFDX response")
             return None
-            
-        return {
+        
+        _session.headers.update({"Authorization": f"Bearer {access_token}"})
+        _connection = {
             "instance_url": instance_url,
             "access_token": access_token
         }
+        return _connection
     except Exception as e:
         print(f"Error getting Tooling API connection: {str(e)}")
         return None
@@ -103,36 +218,259 @@ def fuzzy_match(search_term, text, threshold=DEFAULT_SIMILARITY_THRESHOLD):
     # None check
     if text is None:
         return False
-        
+    
+    return _fuzzy_match_lower(search_term.lower(), text.lower(), threshold)
+
+def _fuzzy_match_lower(term_lc, text_lc, threshold=DEFAULT_SIMILARITY_THRESHOLD):
+    """Check if an already-lowercased search term fuzzy matches already-lowercased text"""
     # Simple case: direct substring match
-    if search_term.lower() in text.lower():
+    if term_lc in text_lc:
         return True
     
-    # Advanced case: fuzzy matching using difflib
-    similarity = difflib.SequenceMatcher(None, search_term.lower(), text.lower()).ratio()
-    return similarity >= threshold
+    return _similarity_match(term_lc, text_lc, threshold)
 
-def get_object_fields(object_name):
-    """Get all fields for a specific object
+def _similarity_match(term_lc, text_lc, threshold=DEFAULT_SIMILARITY_THRESHOLD):
+    """Check the fuzzy similarity of lowercased strings, without the substring check"""
+    # Advanced case: fuzzy matching using rapidfuzz (same scorer as search_fields_multi_terms)
+    if HAS_RAPIDFUZZ:
+        # A term that preprocessing reduces to nothing would score 100 against empty text
+        if not utils.default_process(term_lc):
+            return False
+        score_cutoff = max(threshold * 100 - SCORE_EPSILON, 0)
+        score = fuzz.partial_ratio(term_lc, text_lc, processor=utils.default_process,
+                                   score_cutoff=score_cutoff)
+        return score >= score_cutoff
+    
+    # Fallback: fuzzy matching using character bigrams
+    return _bigram_similarity(_text_bigrams(term_lc), _text_bigrams(text_lc)) >= threshold
+
+def _text_bigrams(text_lc):
+    """Get the set of two-character substrings of a lowercased string"""
+    return frozenset(text_lc[i:i + 2] for i in range(len(text_lc) - 1))
+
+def _bigram_similarity(bigrams_a, bigrams_b):
+    """Score two bigram sets from 0 to 1 (Dice coefficient)
+    
+    This is on the same 2*matches/total scale as difflib's ratio(), so the
+    similarity threshold keeps its meaning, but it only costs a set
+    intersection instead of difflib's longest-match search.
+    """
+    return 2 * len(bigrams_a & bigrams_b) / max(len(bigrams_a) + len(bigrams_b), 1)
+
+def _describe_fields_rest(connection, object_name):
+    """Yield the fields of an object from the REST describe endpoint
+    
+    Returns without yielding anything if the request fails.
+    """
+    url = f"{connection['instance_url']}/services/data/v{API_VERSION}/sobjects/{object_name}/describe"
+    response = _session.get(url, stream=HAS_IJSON and not HAS_MSGSPEC)
+    
+    if response.status_code != 200:
+        print(f"Describe request for {object_name} failed with status {response.status_code}: {response.text[:500]}")
+        return
+    
+    if HAS_MSGSPEC:
+        # Decode the raw bytes straight into structs, skipping the unused keys
+        result = msgspec.json.decode(response.content, type=DescribeResult)
+        for field in result.fields:
+            yield {
+                'name': field.name,
+                'label': field.label,
+                'type': field.type,
+                'description': field.description
+            }
+    elif HAS_IJSON:
+        # Let urllib3 undo any gzip encoding before ijson reads the raw stream
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, 'fields.item', use_float=True)
+    else:
+        yield from response.json().get('fields', [])
+
+def _describe_fields_sfdx(object_name):
+    """Yield the fields of an object using the SFDX CLI"""
+    cmd = f'sfdx force:schema:sobject:describe -s {object_name} --json'
+    
+    if HAS_IJSON:
+        yield from run_sfdx_command(cmd, stream=True, stream_prefix='result.fields.item')
+        return
+    
+    result = run_sfdx_command(cmd)
+    if result and 'result' in result and 'fields' in result['result']:
+        yield from result['result']['fields']
+
+def _iter_object_fields(object_name):
+    """Iterate over all fields for a specific object
+    
+    Fields are requested directly from the REST describe endpoint, falling back
+    to the SFDX CLI if no connection is available. REST responses are decoded
+    into typed structs when msgspec is available; otherwise they are streamed
+    when ijson is available, so only one field is held in memory at a time.
     
     Args:
         object_name: API name of the Salesforce object
         
     Returns:
-        List of field dictionaries with name, label, type, etc.
+        Iterator of field dictionaries with name, label, type, etc.
     """
     try:
-        cmd = f'sfdx force:schema:sobject:describe -s {object_name} --json'
-        result = run_sfdx_command(cmd)
+        connection = get_tooling_api_connection()
+        if connection:
+            fields = _describe_fields_rest(connection, object_name)
+        else:
+            fields = _describe_fields_sfdx(object_name)
         
-        if not result or 'result' not in result or 'fields' not in result['result']:
-            print(f"Failed to get fields for object: {object_name}")
-            return []
+        field_count = 0
+        for field in fields:
+            field_count += 1
+            yield field
         
-        return result['result']['fields']
+        if field_count == 0:
+            print(f"Failed to get fields for object: {object_name}")
     except Exception as e:
         print(f"Error getting fields for {object_name}: {str(e)}")
-        return []
+
+def _build_field_columns(fields, object_name):
+    """Build parallel field lists from an iterable of field dictionaries
+    
+    Each field is projected into a lean Field record as it arrives, so the
+    rest of the describe data is not kept. The searchable text of each field
+    is lowercased once here, so matching does not have to lowercase it again
+    for every search term.
+    
+    Args:
+        fields: Iterable of field dictionaries
+        object_name: API name of the object the fields belong to
+        
+    Returns:
+        Dictionary of parallel lists: 'fields' (Field records),
+        'names', 'labels', 'descriptions' and their lowercased
+        'names_lc', 'labels_lc', 'descriptions_lc' counterparts. Without
+        rapidfuzz, the bigram sets of the lowercased text are also included as
+        'names_bg', 'labels_bg', 'descriptions_bg'
+    """
+    columns = {
+        'fields': [],
+        'names': [],
+        'labels': [],
+        'descriptions': [],
+        'names_lc': [],
+        'labels_lc': [],
+        'descriptions_lc': []
+    }
+    if not HAS_RAPIDFUZZ:
+        columns.update({'names_bg': [], 'labels_bg': [], 'descriptions_bg': []})
+    
+    for field in fields:
+        name = field.get('name') or ''
+        label = field.get('label') or ''
+        description = field.get('description') or ''
+        
+        # There are only a couple of dozen field types, so share one copy of each
+        field_type = sys.intern(field.get('type') or '')
+        
+        columns['fields'].append(Field(name, label, field_type, field.get('description'), object_name))
+        columns['names'].append(name)
+        columns['labels'].append(label)
+        columns['descriptions'].append(description)
+        columns['names_lc'].append(name.lower())
+        columns['labels_lc'].append(label.lower())
+        columns['descriptions_lc'].append(description.lower())
+        
+        if not HAS_RAPIDFUZZ:
+            columns['names_bg'].append(_text_bigrams(columns['names_lc'][-1]))
+            columns['labels_bg'].append(_text_bigrams(columns['labels_lc'][-1]))
+            columns['descriptions_bg'].append(_text_bigrams(columns['descriptions_lc'][-1]))
+    
+    return columns
+
+def _field_to_dict(field):
+    """Convert a Field record to the dictionary format returned by the search functions"""
+    return {
+        'name': field.name,
+        'label': field.label,
+        'type': field.type,
+        'description': field.description,
+        'objectName': field.object_name
+    }
+
+def get_object_fields(object_name):
+    """Get all fields for a specific object
+    
+    Args:
+        object_name: API name of the Salesforce object
+        
+    Returns:
+        List of field dictionaries with name, label, type, description and objectName
+    """
+    return [_field_to_dict(field) for field in _get_object_field_columns(object_name)['fields']]
+
+def _get_object_field_columns(object_name):
+    """Get all fields for a specific object as parallel lists
+    
+    Results are cached for the rest of the process, including those fetched
+    in bulk by _get_object_fields_bulk.
+    
+    Args:
+        object_name: API name of the Salesforce object
+        
+    Returns:
+        Dictionary of parallel field lists (see _build_field_columns)
+    """
+    columns = _object_fields_cache.get(object_name)
+    if columns is None:
+        columns = _build_field_columns(_iter_object_fields(object_name), object_name)
+        _object_fields_cache[object_name] = columns
+    return columns
+
+def _get_object_fields_bulk(object_names):
+    """Get the fields of several objects using composite describe requests
+    
+    Up to COMPOSITE_BATCH_SIZE describes are sent in each composite request,
+    so M objects take ceil(M / 25) round-trips instead of M. Objects whose
+    describe fails in the batch are fetched individually.
+    
+    Args:
+        object_names: List of object API names
+        
+    Returns:
+        Dictionary mapping object names to parallel field lists (see _build_field_columns)
+    """
+    pending = [name for name in dict.fromkeys(object_names) if name not in _object_fields_cache]
+    connection = get_tooling_api_connection()
+    
+    if connection and pending:
+        url = f"{connection['instance_url']}/services/data/v{API_VERSION}/composite/"
+        
+        for start in range(0, len(pending), COMPOSITE_BATCH_SIZE):
+            batch = pending[start:start + COMPOSITE_BATCH_SIZE]
+            composite_request = {
+                "allOrNone": False,
+                "compositeRequest": [
+                    {
+                        "method": "GET",
+                        "url": f"/services/data/v{API_VERSION}/sobjects/{name}/describe",
+                        "referenceId": f"describe{i}"
+                    }
+                    for i, name in enumerate(batch)
+                ]
+            }
+            
+            try:
+                response = _session.post(url, json=composite_request)
+                if response.status_code != 200:
+                    print(f"Composite describe request failed with status {response.status_code}: {response.text[:500]}")
+                    continue
+                
+                for subresponse in response.json().get('compositeResponse', []):
+                    name = batch[int(subresponse['referenceId'][len('describe'):])]
+                    body = subresponse.get('body')
+                    if subresponse.get('httpStatusCode') == 200 and isinstance(body, dict):
+                        _object_fields_cache[name] = _build_field_columns(body.get('fields', []), name)
+            except Exception as e:
+                print(f"Error in composite describe request: {str(e)}")
+    
+    # Anything not described in bulk falls back to one request per object
+    return {name: _get_object_field_columns(name) for name in object_names}
 
 def search_fields_in_object(object_name, search_term, threshold=DEFAULT_SIMILARITY_THRESHOLD):
     """Search for fields in an object matching a search term
@@ -145,23 +483,17 @@ def search_fields_in_object(object_name, search_term, threshold=DEFAULT_SIMILARI
     Returns:
         List of matching field dictionaries
     """
-    fields = get_object_fields(object_name)
+    columns = _get_object_field_columns(object_name)
+    term_lc = search_term.lower()
     matching_fields = []
     
-    for field in fields:
-        # Check field name
-        name_match = fuzzy_match(search_term, field.get('name', ''), threshold)
-        
-        # Check field label
-        label_match = fuzzy_match(search_term, field.get('label', ''), threshold)
-        
-        # Check field description
-        desc_match = fuzzy_match(search_term, field.get('description', ''), threshold)
-        
-        if name_match or label_match or desc_match:
-            # Add object name to the field info
-            field['objectName'] = object_name
-            matching_fields.append(field)
+    for i, field in enumerate(columns['fields']):
+        # Check field name, then label, then description - stopping at the first
+        # match so the (usually long) description is only scored when needed
+        if (_fuzzy_match_lower(term_lc, columns['names_lc'][i], threshold) or
+                _fuzzy_match_lower(term_lc, columns['labels_lc'][i], threshold) or
+                _fuzzy_match_lower(term_lc, columns['descriptions_lc'][i], threshold)):
+            matching_fields.append(_field_to_dict(field))
     
     return matching_fields
 
@@ -178,6 +510,9 @@ def search_fields_multi_objects(objects, search_term, threshold=DEFAULT_SIMILARI
     """
     results = {}
     
+    # Describe all objects up front; search_fields_in_object reads the cache
+    _get_object_fields_bulk(objects)
+    
     for obj in objects:
         matching_fields = search_fields_in_object(obj, search_term, threshold)
         if matching_fields:
@@ -188,9 +523,107 @@ def search_fields_multi_objects(objects, search_term, threshold=DEFAULT_SIMILARI
     
     return results
 
+def _compile_substring_pattern(terms_lc):
+    """Compile one regex that finds all of the given terms in a single scan
+    
+    The pattern is a lookahead alternation tried at every position with the
+    longest terms first, so each hit is the longest term starting there. Any
+    shorter term starting at the same position is a prefix of that hit, which
+    is why hits are expanded with contained_terms.
+    
+    Args:
+        terms_lc: List of lowercased search terms
+        
+    Returns:
+        Tuple of (compiled pattern, dictionary mapping each term to the set of
+        terms it contains, itself included)
+    """
+    unique_terms = sorted(set(terms_lc), key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(re.escape(term) for term in unique_terms) + '))')
+    contained_terms = {
+        term: {other for other in unique_terms if other in term}
+        for term in unique_terms
+    }
+    return pattern, contained_terms
+
+def _match_fields_multi_terms(columns, search_terms, threshold=DEFAULT_SIMILARITY_THRESHOLD):
+    """Match the fields of one object against several search terms at once
+    
+    When rapidfuzz is available, names, labels and descriptions are each scored
+    against all terms with a single process.cdist call. Exact substring hits
+    are found separately, as rapidfuzz's preprocessing can reduce a term to
+    nothing (e.g. one made only of punctuation); such terms are not scored.
+    
+    Args:
+        columns: Parallel field lists as returned by _get_object_field_columns
+        search_terms: List of terms to search for
+        threshold: Minimum similarity score for fuzzy matching
+        
+    Returns:
+        Dictionary mapping search terms to lists of matching Field records
+    """
+    fields = columns['fields']
+    matches = {term: [] for term in search_terms}
+    if not fields or not search_terms:
+        return matches
+    
+    if not HAS_RAPIDFUZZ:
+        terms_lc = [term.lower() for term in search_terms]
+        terms_bg = [_text_bigrams(term_lc) for term_lc in terms_lc]
+        substring_pattern, contained_terms = _compile_substring_pattern(terms_lc)
+        
+        for i, field in enumerate(fields):
+            texts = (columns['names_lc'][i], columns['labels_lc'][i], columns['descriptions_lc'][i])
+            
+            # One regex scan per text finds every term that occurs in it
+            substring_hits = set()
+            for text in texts:
+                for hit in substring_pattern.findall(text):
+                    substring_hits |= contained_terms[hit]
+            
+            text_bigram_sets = (columns['names_bg'][i], columns['labels_bg'][i], columns['descriptions_bg'][i])
+            for term, term_lc, term_bg in zip(search_terms, terms_lc, terms_bg):
+                if term_lc in substring_hits or any(
+                        _bigram_similarity(term_bg, text_bg) >= threshold for text_bg in text_bigram_sets):
+                    matches[term].append(field)
+        return matches
+    
+    score_cutoff = max(threshold * 100 - SCORE_EPSILON, 0)
+    matched = np.zeros((len(search_terms), len(fields)), dtype=bool)
+    
+    scored_rows = [i for i, term in enumerate(search_terms) if utils.default_process(term)]
+    scored_terms = [search_terms[i] for i in scored_rows]
+    for key in ('names', 'labels', 'descriptions'):
+        if not scored_terms:
+            break
+        scores = process.cdist(scored_terms, columns[key], scorer=fuzz.partial_ratio,
+                               processor=utils.default_process,
+                               score_cutoff=score_cutoff, workers=-1)
+        matched[scored_rows] |= scores >= score_cutoff
+    
+    terms_lc = [term.lower() for term in search_terms]
+    substring_pattern, contained_terms = _compile_substring_pattern(terms_lc)
+    for field_idx in range(len(fields)):
+        # One regex scan per text finds every term that occurs in it
+        substring_hits = set()
+        for key in ('names_lc', 'labels_lc', 'descriptions_lc'):
+            for hit in substring_pattern.findall(columns[key][field_idx]):
+                substring_hits |= contained_terms[hit]
+        for term_idx, term_lc in enumerate(terms_lc):
+            if term_lc in substring_hits:
+                matched[term_idx, field_idx] = True
+    
+    for term_idx, field_idx in np.argwhere(matched):
+        matches[search_terms[term_idx]].append(fields[field_idx])
+    
+    return matches
+
 def search_fields_multi_terms(objects, search_terms, threshold=DEFAULT_SIMILARITY_THRESHOLD):
     """Search for fields matching multiple terms across multiple objects
     
+    Each object is described once and its fields are matched against all
+    terms together.
+    
     Args:
         objects: List of object API names to search
         search_terms: List of terms to search for
@@ -199,11 +632,19 @@ def search_fields_multi_terms(objects, search_terms, threshold=DEFAULT_SIMILARIT
     Returns:
         Dictionary mapping search terms to dictionaries of object results
     """
-    results = {}
+    results = {term: {} for term in search_terms}
+    object_fields = _get_object_fields_bulk(objects)
     
-    for term in search_terms:
-        print(f"\nSearching for term: {term}")
-        results[term] = search_fields_multi_objects(objects, term, threshold)
+    for obj in objects:
+        print(f"\nSearching {obj} for terms: {', '.join(search_terms)}")
+        columns = object_fields[obj]
+        
+        for term, matching_fields in _match_fields_multi_terms(columns, search_terms, threshold).items():
+            if matching_fields:
+                results[term][obj] = [_field_to_dict(field) for field in matching_fields]
+                print(f"Found {len(matching_fields)} fields matching '{term}' in {obj}")
+            else:
+                print(f"No fields matching '{term}' found in {obj}")
     
     return results
 
@@ -230,8 +671,70 @@ def search_fields_summary(objects, search_terms, threshold=DEFAULT_SIMILARITY_TH
     
     return summary_results
 
-def parse_args():
-    """Parse command-line arguments"""
+def _write_results(results, output_format, out):
+    """Write search results to a file-like object
+    
+    Results are written row by row rather than built up as one string first.
+    
+    Args:
+        results: Dictionary returned by search_fields_multi_terms
+        output_format: One of 'text', 'json' or 'csv'
+        out: File-like object to write to
+    """
+    if output_format == 'json':
+        json.dump(results, out, indent=2)
+    elif output_format == 'csv':
+        import csv
+        
+        writer = csv.writer(out)
+        
+        # Write header
+        writer.writerow(['Search Term', 'Object', 'Field Name', 'Field Label', 'Field Type', 'Description'])
+        
+        # Write results
+        for term, obj_results in results.items():
+            for obj, fields in obj_results.items():
+                for field in fields:
+                    writer.writerow([
+                        term,
+                        obj,
+                        field.get('name', ''),
+                        field.get('label', ''),
+                        field.get('type', ''),
+                        field.get('description', '')
+                    ])
+    else:  # text format
+        for term, obj_results in results.items():
+            out.write(f"\nResults for term '{term}':\n")
+            out.write("=" * 80 + "\n")
+            
+            if not obj_results:
+                out.write("No matching fields found in any object\n")
+                continue
+            
+            for obj, fields in obj_results.items():
+                out.write(f"\nObject: {obj}\n")
+                out.write("-" * 40 + "\n")
+                
+                for field in fields:
+                    out.write(f"Name: {field.get('name', '')}\n")
+                    out.write(f"Label: {field.get('label', '')}\n")
+                    out.write(f"Type: {field.get('type', '')}\n")
+                    if field.get('description'):
+                        out.write(f"Description: {field.get('description')}\n")
+                    out.write("\n")
+
+def parse_args(argv=None):
+    """Parse command-line arguments
+    
+    Args:
+        argv: Argument list to parse (default: sys.argv[1:]); the result is
+            cached, so parsing the same arguments again is free
+    """
+    key = tuple(sys.argv[1:] if argv is None else argv)
+    if key in _parsed_args:
+        return _parsed_args[key]
+    
     parser = argparse.ArgumentParser(description='Search for fields in Salesforce objects')
     parser.add_argument('search_term', type=str, help='Text to search for (comma-separated for multiple terms)')
     parser.add_argument('--objects', '-o', type=str, required=True,
@@ -242,13 +745,17 @@ def parse_args():
                         help='Output format (default: text)')
     parser.add_argument('--output-file', type=str, 
                         help='File to save results to (default: output to console)')
-    return parser.parse_args()
+    _parsed_args[key] = parser.parse_args(list(key))
+    return _parsed_args[key]
 
-def main():
+def main(argv=None):
     """Main function"""
     try:
         # Parse command-line arguments
-        args = parse_args()
+        args = parse_args(argv)
+        
+        # Authenticate once up front; describe calls reuse this connection
+        check_sfdx_installed()
         
         # Split search terms and objects
         search_terms = [term.strip() for term in args.search_term.split(',')]
@@ -261,62 +768,16 @@ def main():
         # Search for fields
         results = search_fields_multi_terms(objects, search_terms, args.threshold)
         
-        # Format and output results
-        if args.output == 'json':
-            output = json.dumps(results, indent=2)
-        elif args.output == 'csv':
-            import csv
-            import io
-            
-            output_buffer = io.StringIO()
-            writer = csv.writer(output_buffer)
-            
-            # Write header
-            writer.writerow(['Search Term', 'Object', 'Field Name', 'Field Label', 'Field Type', 'Description'])
-            
-            # Write results
-            for term, obj_results in results.items():
-                for obj, fields in obj_results.items():
-                    for field in fields:
-                        writer.writerow([
-                            term,
-                            obj,
-                            field.get('name', ''),
-                            field.get('label', ''),
-                            field.get('type', ''),
-                            field.get('description', '')
-                        ])
-            
-            output = output_buffer.getvalue()
-        else:  # text format
-            output = ""
-            for term, obj_results in results.items():
-                output += f"\nResults for term '{term}':\n"
-                output += "=" * 80 + "\n"
-                
-                if not obj_results:
-                    output += "No matching fields found in any object\n"
-                    continue
-                
-                for obj, fields in obj_results.items():
-                    output += f"\nObject: {obj}\n"
-                    output += "-" * 40 + "\n"
-                    
-                    for field in fields:
-                        output += f"Name: {field.get('name', '')}\n"
-                        output += f"Label: {field.get('label', '')}\n"
-                        output += f"Type: {field.get('type', '')}\n"
-                        if field.get('description'):
-                            output += f"Description: {field.get('description')}\n"
-                        output += "\n"
-        
         # Output results
         if args.output_file:
-            with open(args.output_file, 'w') as f:
-                f.write(output)
+            # The csv module writes its own line endings
+            newline = '' if args.output == 'csv' else None
+            with open(args.output_file, 'w', newline=newline) as f:
+                _write_results(results, args.output, f)
             print(f"\nResults saved to {args.output_file}")
         else:
-            print(output)
+            _write_results(results, args.output, sys.stdout)
+            sys.stdout.write("\n")
         
     except KeyboardInterrupt:
         print("\nProcess interrupted by user")
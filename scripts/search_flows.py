@@ -4,12 +4,87 @@ import subprocess
 import json
 import argparse
 import sys
+import os
+import re
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 import requests
-import difflib
+from requests.adapters import HTTPAdapter
+
+import sf_org_config
+
+# Try to import a C implementation of SequenceMatcher - it has the same API as
+# difflib's and is much faster on the fallback scoring path if available
+try:
+    from cydifflib import SequenceMatcher
+except ImportError:
+    try:
+        from cdifflib import CSequenceMatcher as SequenceMatcher
+    except ImportError:
+        from difflib import SequenceMatcher
+
+# Try to import rapidfuzz - we'll use its C++ scorers for fuzzy matching if available
+try:
+    from rapidfuzz import fuzz, process, utils
+    import numpy as np
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# Try to import orjson - we'll use it to parse large API and CLI responses if available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # The minimum similarity score (0-1) required for a fuzzy match
 DEFAULT_SIMILARITY_THRESHOLD = 0.6
 
+# Slack for comparing rapidfuzz scores (0-100) with threshold * 100, which is
+# inexact for thresholds such as 0.55; matches search_fields
+SCORE_EPSILON = 1e-4
+
+# Without rapidfuzz, term/label scoring is spread over worker processes once
+# there are at least this many pairs to compare
+PARALLEL_MIN_PAIRS = 50000
+
+# Valid values of Flow.Status, used to validate status filters before querying
+FLOW_STATUSES = ('Active', 'Draft', 'Obsolete', 'InvalidDraft')
+
+# Flow fields kept from each Tooling API record
+FLOW_FIELDS = ('Id', 'MasterLabel', 'DefinitionId', 'Status')
+
+# Where the last working API version for each org is remembered between runs
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".sfdcaudit_cache.json")
+
+# Where each org's full flow list is cached between runs
+FLOW_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".sfdcaudit_cache")
+
+# Refresh token for the default org, so later runs can authenticate without the CLI
+AUTH_CACHE_FILE = os.path.join(FLOW_CACHE_DIR, "auth.json")
+
+# Shared HTTP session so Tooling API calls reuse pooled keep-alive connections
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Connection details from the one-time auth bootstrap (see get_tooling_api_connection)
+_connection = None
+
+# (labels, labels_lower, threshold) handed to each matching worker process once
+_worker_args = None
+
+def _loads_json(data):
+    """Parse a JSON str or bytes payload, using orjson if available
+    
+    orjson's decode errors subclass json.JSONDecodeError, so callers can catch
+    that either way.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def run_sfdx_command(command, capture_json=True):
     """Run an SFDX command and return the result"""
     try:
@@ -31,7 +106,7 @@ def run_sfdx_command(command, capture_json=True):
         
         if capture_json:
             try:
-                return json.loads(result.stdout)
+                return _loads_json(result.stdout)
             except json.JSONDecodeError as e:
                 print(f"Error parsing JSON from command: {command}")
                 print(f"Error details: {str(e)}")
@@ -45,7 +120,14 @@ def run_sfdx_command(command, capture_json=True):
         return None
 
 def check_sfdx_installed():
-    """Check if SFDX CLI is installed and authorized"""
+    """Check if SFDX CLI is installed and authorized
+    
+    This is a one-time bootstrap: the org display call made here also caches
+    the connection used for the Tooling API queries.
+    """
+    if get_tooling_api_connection():
+        return True
+    
     try:
         # Check if SFDX is installed
         subprocess.run(
@@ -56,15 +138,6 @@ def check_sfdx_installed():
             stderr=subprocess.PIPE,
             text=True
         )
-        
-        # Check if there's an authorized org
-        result = run_sfdx_command("sfdx force:org:display --json")
-        if not result or 'result' not in result:
-            print("No authorized Salesforce org found.")
-            print("Please authorize an org using: sfdx force:auth:web:login")
-            sys.exit(1)
-            
-        return True
     except subprocess.CalledProcessError:
         print("SFDX CLI not found or not properly installed.")
         print("Please install SFDX CLI from: https://developer.salesforce.com/tools/sfdxcli")
@@ -72,53 +145,569 @@ def check_sfdx_installed():
     except Exception as e:
         print(f"Error checking SFDX installation: {e}")
         sys.exit(1)
+    
+    print("No authorized Salesforce org found.")
+    print("Please authorize an org using: sfdx force:auth:web:login")
+    sys.exit(1)
 
-def get_tooling_api_connection():
-    """Get connection information for the Tooling API"""
+def _save_auth(auth):
+    """Save the refresh token details, readable only by the current user"""
     try:
-        # Get org authentication details
-        auth_result = run_sfdx_command("sfdx force:org:display --json")
-        if not auth_result or 'result' not in auth_result:
-            print("Failed to get org authentication details")
-            return None
-        
-        # Extract instance URL and access token
-        instance_url = auth_result["result"].get("instanceUrl")
-        access_token = auth_result["result"].get("accessToken")
+        os.makedirs(FLOW_CACHE_DIR, exist_ok=True)
+        fd = os.open(AUTH_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(auth, f)
+        os.chmod(AUTH_CACHE_FILE, 0o600)
+    except OSError as e:
+        print(f"Could not save auth cache: {str(e)}")
+
+def _load_auth(username):
+    """Load the saved refresh token details if they belong to the given org username"""
+    if not username:
+        return None
+    
+    try:
+        with open(AUTH_CACHE_FILE, 'r') as f:
+            auth = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if auth.get('username') != username or not auth.get('org_id'):
+        return None
+    return auth
+
+def _refresh_access_token(auth):
+    """Get a new access token with the OAuth refresh token flow
+    
+    Args:
+        auth: Saved auth details from _load_auth
         
-        if not instance_url or not access_token:
-            print("Missing instanceUrl or accessToken in SFDX response")
-            return None
+    Returns:
+        Connection details like get_tooling_api_connection's, or None if the refresh failed
+    """
+    data = {
+        "grant_type": "refresh_token",
+        "client_id": auth["client_id"],
+        "refresh_token": auth["refresh_token"]
+    }
+    if auth.get("client_secret"):
+        data["client_secret"] = auth["client_secret"]
+    
+    try:
+        response = _session.post(f"{auth['instance_url']}/services/oauth2/token", data=data,
+                                 headers={"Content-Type": "application/x-www-form-urlencoded"})
+    except requests.RequestException as e:
+        print(f"Error refreshing access token: {str(e)}")
+        return None
+    
+    if response.status_code != 200:
+        print(f"Could not refresh access token ({response.status_code}), using SFDX CLI instead")
+        return None
+    
+    token = _loads_json(response.content)
+    
+    # The identity URL (https://<host>/id/<orgId>/<userId>) says which org the
+    # token is for; org IDs are compared in their 15-character form
+    identity_parts = (token.get("id") or "").rstrip('/').split('/')
+    token_org_id = identity_parts[-2] if len(identity_parts) >= 2 else ""
+    if not token_org_id or token_org_id[:15] != auth["org_id"][:15]:
+        print("Refreshed access token is for a different org, using SFDX CLI instead")
+        return None
+    
+    return {
+        "instance_url": token.get("instance_url") or auth["instance_url"],
+        "access_token": token["access_token"],
+        "org_id": auth.get("org_id")
+    }
+
+def get_tooling_api_connection():
+    """Get connection information for the Tooling API
+    
+    If a refresh token was saved for the CLI's default org (resolved from the
+    CLI's environment and config files), a new access token is requested from
+    Salesforce directly, without starting the SFDX CLI. The saved token is
+    only reused if the default org resolves to the username it was saved for.
+    Otherwise (or if that fails) the org is displayed with the CLI, which also
+    saves the refresh token for next time. This happens once per process;
+    later calls return the cached connection. The access token is also set on
+    the shared HTTP session.
+    """
+    global _connection
+    if _connection is not None:
+        return _connection
+    
+    try:
+        auth = _load_auth(sf_org_config.get_target_org_username())
+        connection = _refresh_access_token(auth) if auth else None
+        
+        if connection is None:
+            # Get org authentication details
+            auth_result = run_sfdx_command("sfdx force:org:display --verbose --json")
+            if not auth_result or 'result' not in auth_result:
+                print("Failed to get org authentication details")
+                return None
             
-        return {
-            "instance_url": instance_url,
-            "access_token": access_token
-        }
+            # Extract instance URL and access token
+            instance_url = auth_result["result"].get("instanceUrl")
+            access_token = auth_result["result"].get("accessToken")
+            
+            if not instance_url or not access_token:
+                print("Missing instanceUrl or accessToken in SFDX response")
+                return None
+            
+            connection = {
+                "instance_url": instance_url,
+                "access_token": access_token,
+                "org_id": auth_result["result"].get("id")
+            }
+            
+            # The auth URL (only shown with --verbose, and only for orgs
+            # authorized with a refresh token) has the form
+            # force://<clientId>:<clientSecret>:<refreshToken>@<host>
+            auth_url = auth_result["result"].get("sfdxAuthUrl")
+            username = auth_result["result"].get("username")
+            if auth_url and auth_url.startswith("force://") and username and connection["org_id"]:
+                try:
+                    credentials = auth_url[len("force://"):].rpartition('@')[0]
+                    client_id, client_secret, refresh_token = credentials.split(':', 2)
+                except ValueError:
+                    # Not worth failing over; the connection above is still valid
+                    print("Unexpected sfdxAuthUrl format, not saving the refresh token")
+                else:
+                    _save_auth({
+                        "username": username,
+                        "instance_url": instance_url,
+                        "org_id": connection["org_id"],
+                        "client_id": client_id,
+                        "client_secret": client_secret,
+                        "refresh_token": refresh_token
+                    })
+        
+        _session.headers.update({
+            "Authorization": f"Bearer {connection['access_token']}",
+            "Content-Type": "application/json"
+        })
+        _connection = connection
+        return _connection
     except Exception as e:
         print(f"Error getting Tooling API connection: {str(e)}")
         return None
 
-def fuzzy_match(search_term, text, threshold=DEFAULT_SIMILARITY_THRESHOLD):
-    """Check if the search term fuzzy matches the text"""
-    # Simple case: direct substring match
-    if search_term.lower() in text.lower():
-        return True
+def _load_cache():
+    """Load the on-disk cache, or an empty one if it is missing or unreadable"""
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_working_api_version(instance_url, api_version):
+    """Remember the API version that worked for an org so the next run tries it first"""
+    cache = _load_cache()
+    cache.setdefault('api_versions', {})[instance_url] = api_version
+    try:
+        with open(CACHE_FILE, 'w') as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        print(f"Could not save API version cache: {str(e)}")
+
+def _get_latest_api_version(instance_url):
+    """Ask the org for its supported API versions and return the newest one
     
-    # Advanced case: fuzzy matching using difflib
-    similarity = difflib.SequenceMatcher(None, search_term.lower(), text.lower()).ratio()
-    return similarity >= threshold
+    Args:
+        instance_url: Salesforce instance URL
+        
+    Returns:
+        The newest API version string (e.g. '58.0'), or None if it could not be found
+    """
+    response = _session.get(f"{instance_url}/services/data/")
+    if response.status_code != 200:
+        print(f"Error listing API versions: {response.status_code}")
+        print(response.text[:500])  # Show first 500 chars of error
+        return None
+    
+    versions = [v['version'] for v in _loads_json(response.content) if 'version' in v]
+    if not versions:
+        return None
+    return max(versions, key=float)
+
+def _soql_like_pattern(term):
+    """Build a SOQL LIKE pattern matching labels that contain the term
+    
+    Quotes and backslashes are escaped to keep the term from breaking out of
+    the string literal, and % and _ so they match literally.
+    """
+    escaped = (term.replace('\\', '\\\\').replace("'", "\\'")
+               .replace('%', '\\%').replace('_', '\\_'))
+    return f"'%{escaped}%'"
+
+def _run_tooling_query(instance_url, query):
+    """Run a Tooling API query and return its first page of results
+    
+    Uses the API version that worked last time for this org. Otherwise (or if
+    that version is no longer available) the newest version the org supports
+    is looked up once through /services/data/ and remembered for next time.
+    
+    Args:
+        instance_url: Salesforce instance URL
+        query: SOQL query to run
+        
+    Returns:
+        The first page of the query result JSON, or None if the query failed
+    """
+    params = {"q": query}
+    
+    cached_version = _load_cache().get('api_versions', {}).get(instance_url)
+    api_version = cached_version or _get_latest_api_version(instance_url)
+    if not api_version:
+        print("Could not find a working API version")
+        return None
+    
+    print(f"Querying flows using API v{api_version}...")
+    response = _session.get(f"{instance_url}/services/data/v{api_version}/tooling/query",
+                            params=params)
+    
+    # The remembered version may have been retired since the last run
+    if response.status_code == 404 and cached_version:
+        print(f"API v{api_version} not available, looking up the latest version...")
+        api_version = _get_latest_api_version(instance_url)
+        if not api_version:
+            print("Could not find a working API version")
+            return None
+        
+        print(f"Querying flows using API v{api_version}...")
+        response = _session.get(f"{instance_url}/services/data/v{api_version}/tooling/query",
+                                params=params)
+    
+    if response.status_code != 200:
+        print(f"Error with API v{api_version}: {response.status_code}")
+        print(response.text[:500])  # Show first 500 chars of error
+        return None
+    
+    print(f"Successfully connected to Tooling API using v{api_version}")
+    if api_version != cached_version:
+        _save_working_api_version(instance_url, api_version)
+    return _loads_json(response.content)
+
+def _get_flows_stamp(instance_url):
+    """Get a cheap fingerprint of the org's flows: their count and latest LastModifiedDate
+    
+    The count catches deleted flows, which don't change the latest date.
+    
+    Returns:
+        [count, latest LastModifiedDate], or None if it could not be queried
+    """
+    result = _run_tooling_query(
+        instance_url, "SELECT COUNT(Id) total, MAX(LastModifiedDate) lastModified FROM Flow")
+    if not result or not result.get('records'):
+        return None
+    
+    record = result['records'][0]
+    return [record.get('total'), record.get('lastModified')]
+
+def _flow_cache_path(connection):
+    """Path of the flow list cache file for the connected org"""
+    org_key = connection.get("org_id") or re.sub(r'\W+', '_', connection["instance_url"])
+    return os.path.join(FLOW_CACHE_DIR, f"flows_{org_key}.json")
+
+def _load_cached_flows(connection, stamp):
+    """Return the cached flow records for the org if they are still current, else None"""
+    try:
+        with open(_flow_cache_path(connection), 'rb') as f:
+            cached = _loads_json(f.read())
+    except (OSError, ValueError):
+        return None
+    
+    if cached.get('stamp') != stamp:
+        return None
+    return cached.get('records')
+
+def _save_cached_flows(connection, stamp, records):
+    """Write the org's flow records to the cache, tagged with their stamp"""
+    try:
+        os.makedirs(FLOW_CACHE_DIR, exist_ok=True)
+        with open(_flow_cache_path(connection), 'w') as f:
+            json.dump({'stamp': stamp, 'records': records}, f)
+    except OSError as e:
+        print(f"Could not save flow cache: {str(e)}")
+
+def _query_flows_tooling_api(connection, status_filter=None, like_terms=None, use_cache=True):
+    """Query all flows through the Tooling API
+    
+    Without filters, the full flow list is cached on disk per org and reused
+    as long as the flow count and latest LastModifiedDate are unchanged,
+    which costs one small aggregate query instead of downloading every flow.
+    
+    Args:
+        connection: Connection details from get_tooling_api_connection
+        status_filter: Optional filter for flow status (e.g., 'Active', 'Draft')
+        like_terms: Optional terms; if given, only flows whose MasterLabel
+            contains at least one of them are returned
+        use_cache: Whether to use the on-disk flow list cache
+        
+    Returns:
+        The query result with all pages of 'records', or None if the query failed
+    """
+    instance_url = connection["instance_url"]
+    
+    # Build query with or without status and label filters
+    conditions = []
+    if status_filter:
+        conditions.append(f"Status = '{status_filter}'")
+    if like_terms:
+        like_clauses = [f"MasterLabel LIKE {_soql_like_pattern(term)}" for term in like_terms]
+        conditions.append(f"({' OR '.join(like_clauses)})")
+    
+    query = f"SELECT {', '.join(FLOW_FIELDS)} FROM Flow"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    
+    # Only the unfiltered flow list is cached
+    stamp = None
+    if use_cache and not conditions:
+        stamp = _get_flows_stamp(instance_url)
+        if stamp is not None:
+            records = _load_cached_flows(connection, stamp)
+            if records is not None:
+                print(f"Using cached flow list ({len(records)} flows, unchanged since last run)")
+                return {'totalSize': len(records), 'records': records}
+    
+    result = _run_tooling_query(instance_url, query)
+    if result is None:
+        return None
+    
+    # Keep only the flow fields from each page of records (dropping the
+    # per-record 'attributes' blocks) and follow nextRecordsUrl until done,
+    # so large orgs aren't silently truncated to the first batch
+    records = []
+    complete = True
+    while True:
+        for record in result.get('records', []):
+            records.append({key: record[key] for key in FLOW_FIELDS if key in record})
+        
+        next_url = result.get('nextRecordsUrl')
+        if result.get('done', True) or not next_url:
+            break
+        
+        response = _session.get(f"{instance_url}{next_url}")
+        if response.status_code != 200:
+            print(f"Error fetching more flows: {response.status_code}")
+            print(response.text[:500])  # Show first 500 chars of error
+            complete = False
+            break
+        result = _loads_json(response.content)
+    
+    if stamp is not None and complete:
+        _save_cached_flows(connection, stamp, records)
+    
+    return {'totalSize': len(records), 'records': records}
+
+def fuzzy_match(search_term, text, threshold=DEFAULT_SIMILARITY_THRESHOLD, term_lower=None, text_lower=None):
+    """Check if the search term fuzzy matches the text
+    
+    Callers comparing the same strings many times can pass their lowercased
+    forms as term_lower/text_lower so they are only computed once.
+    
+    Returns:
+        The similarity score (0-1, 1.0 for substring matches), or None if the
+        text does not match
+    """
+    if term_lower is None:
+        term_lower = search_term.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+    
+    # Simple case: direct substring match (this also covers exact matches)
+    if term_lower in text_lower:
+        return 1.0
+    
+    return _fuzzy_match_slow(search_term, text, threshold, term_lower, text_lower)
+
+def _fuzzy_match_slow(search_term, text, threshold, term_lower, text_lower):
+    """Score the search term against the text, skipping the substring check
+    
+    Hot loops check `term_lower in text_lower` inline and only call this for
+    the labels that don't contain the term, saving a function call per hit.
+    """
+    # Advanced case: fuzzy matching using rapidfuzz, which can stop early
+    # once the score can no longer reach the cutoff
+    if HAS_RAPIDFUZZ:
+        score_cutoff = max(threshold * 100 - SCORE_EPSILON, 0)
+        score = fuzz.WRatio(search_term, text, processor=utils.default_process,
+                            score_cutoff=score_cutoff)
+        return score / 100 if score >= score_cutoff else None
+    
+    # Fallback: fuzzy matching using difflib. Its ratio is 2*M/(la+lt) where
+    # M, the number of matching characters, is at most min(la, lt), so pairs
+    # whose lengths are too different can be rejected without running it
+    la, lt = len(term_lower), len(text_lower)
+    if 2 * min(la, lt) < threshold * (la + lt):
+        return None
+    similarity = SequenceMatcher(None, term_lower, text_lower).ratio()
+    return similarity if similarity >= threshold else None
+
+def _score_term(term, labels, labels_lower, threshold):
+    """Find the (index, score) pairs of the labels one term matches, without rapidfuzz"""
+    term_lower = term.lower()
+    term_hits = []
+    for j, label in enumerate(labels):
+        if term_lower in labels_lower[j]:
+            term_hits.append((j, 1.0))
+            continue
+        score = _fuzzy_match_slow(term, label, threshold, term_lower, labels_lower[j])
+        if score is not None:
+            term_hits.append((j, score))
+    return term_hits
+
+def _init_match_worker(labels, labels_lower, threshold):
+    """Give a worker process the labels once, instead of pickling them per term"""
+    global _worker_args
+    _worker_args = (labels, labels_lower, threshold)
 
-def search_flows_with_tooling_api(search_term, threshold=DEFAULT_SIMILARITY_THRESHOLD, status_filter=None):
+def _score_term_in_worker(term):
+    """Run _score_term in a worker process set up by _init_match_worker"""
+    return _score_term(term, *_worker_args)
+
+def _match_terms_to_labels(search_terms, labels, threshold=DEFAULT_SIMILARITY_THRESHOLD):
+    """Find which labels each search term fuzzy matches
+    
+    Uses the same rules as fuzzy_match. With rapidfuzz, all terms are scored
+    against all labels in a single process.cdist call (C++, multi-threaded)
+    instead of one Python-level comparison per pair. Without it, large
+    searches score each term in a separate worker process.
+    
+    Args:
+        search_terms: List of terms to search for
+        labels: List of labels to search in
+        threshold: Minimum similarity score for fuzzy matching (0-1)
+        
+    Returns:
+        List with, for each search term, the (index, score) pairs of its
+        matching labels sorted by index
+    """
+    # Lowercase every label once, not once per search term
+    labels_lower = [label.lower() for label in labels]
+    
+    if not HAS_RAPIDFUZZ:
+        if len(search_terms) > 1 and len(search_terms) * len(labels) >= PARALLEL_MIN_PAIRS:
+            try:
+                with ProcessPoolExecutor(initializer=_init_match_worker,
+                                         initargs=(labels, labels_lower, threshold)) as executor:
+                    return list(executor.map(_score_term_in_worker, search_terms))
+            except Exception as e:
+                print(f"Parallel matching failed, matching terms one at a time: {str(e)}")
+        
+        return [_score_term(term, labels, labels_lower, threshold) for term in search_terms]
+    
+    score_cutoff = max(threshold * 100 - SCORE_EPSILON, 0)
+    scores = process.cdist(search_terms, labels, scorer=fuzz.WRatio,
+                           processor=utils.default_process,
+                           score_cutoff=score_cutoff, workers=-1)
+    
+    matches = []
+    for i, term in enumerate(search_terms):
+        term_lower = term.lower()
+        hits = {j: float(scores[i][j]) / 100 for j in np.flatnonzero(scores[i] >= score_cutoff).tolist()}
+        # Substring matches always count, whatever their WRatio score
+        hits.update((j, 1.0) for j, label in enumerate(labels_lower) if term_lower in label)
+        matches.append(sorted(hits.items()))
+    return matches
+
+def _any_match_per_term(labels, search_terms, threshold=DEFAULT_SIMILARITY_THRESHOLD):
+    """Check which search terms match at least one label, without collecting the matches
+    
+    Uses the same rules as _match_terms_to_labels, but stops at the first
+    match for each term (or, with rapidfuzz, reduces the cdist scores with
+    np.any instead of collecting indices).
+    
+    Returns:
+        Dictionary mapping each search term to whether it matched any label
+    """
+    labels_lower = [label.lower() for label in labels]
+    
+    if HAS_RAPIDFUZZ:
+        score_cutoff = max(threshold * 100 - SCORE_EPSILON, 0)
+        scores = process.cdist(search_terms, labels, scorer=fuzz.WRatio,
+                               processor=utils.default_process,
+                               score_cutoff=score_cutoff, workers=-1)
+        fuzzy_hits = np.any(scores >= score_cutoff, axis=1)
+        return {
+            term: bool(fuzzy_hits[i]) or any(term.lower() in label for label in labels_lower)
+            for i, term in enumerate(search_terms)
+        }
+    
+    found = {}
+    for term in search_terms:
+        term_lower = term.lower()
+        found[term] = any(
+            term_lower in label_lower
+            or _fuzzy_match_slow(term, label, threshold, term_lower, label_lower) is not None
+            for label, label_lower in zip(labels, labels_lower)
+        )
+    return found
+
+def search_flows_with_tooling_api(search_term, threshold=DEFAULT_SIMILARITY_THRESHOLD, status_filter=None,
+                                  prefilter=False, use_cache=True):
     """Search for flows containing a fuzzy match to the search term in the MasterLabel field
     
     Args:
         search_term: The text to search for in flow labels
         threshold: Minimum similarity score for fuzzy matching (0-1)
         status_filter: Optional filter for flow status (e.g., 'Active', 'Draft')
+        prefilter: Only fetch flows whose label contains the search term (a
+            SOQL LIKE filter). Much less data on large orgs, but fuzzy-only
+            matches are not found.
+        use_cache: Whether to reuse the on-disk flow list if it is current
         
     Returns:
         List of matching flow dictionaries with MasterLabel, DefinitionId, and Status
     """
+    flows = _fetch_flows([search_term], status_filter, prefilter, use_cache)
+    if flows is None:
+        return []
+    
+    # Filter flows using fuzzy matching on MasterLabel
+    term_lower = search_term.lower()
+    matching_flows = []
+    for flow in flows:
+        label = flow['MasterLabel'] or ''
+        label_lower = label.lower()
+        score = 1.0 if term_lower in label_lower else _fuzzy_match_slow(search_term, label, threshold, term_lower, label_lower)
+        if score is not None:
+            # Create simplified flow record with just the fields we want
+            matching_flows.append({
+                'MasterLabel': flow.get('MasterLabel', ''),
+                'DefinitionId': flow.get('DefinitionId', ''),
+                'Status': flow.get('Status', ''),
+                'Id': flow.get('Id', ''),
+                'Score': score
+            })
+    
+    # Sort results by MasterLabel
+    matching_flows.sort(key=lambda x: x.get('MasterLabel', ''))
+    
+    return matching_flows
+
+def _fetch_flows(search_terms, status_filter=None, prefilter=False, use_cache=True):
+    """Fetch the flows to search, through the Tooling API or else the SFDX CLI
+    
+    Args:
+        search_terms: List of terms that will be searched for (used by prefilter)
+        status_filter: Optional filter for flow status (e.g., 'Active', 'Draft')
+        prefilter: Only fetch flows whose label contains one of the search
+            terms (SOQL LIKE filters). Much less data on large orgs, but
+            fuzzy-only matches are not found.
+        use_cache: Whether to reuse the on-disk flow list if it is current
+        
+    Returns:
+        List of flow dictionaries that have a MasterLabel, or None if the
+        flows could not be fetched. Flows from the CLI fallback have no
+        DefinitionId, so it is set to 'N/A'.
+    """
+    if status_filter and status_filter not in FLOW_STATUSES:
+        print(f"Invalid flow status '{status_filter}', expected one of: {', '.join(FLOW_STATUSES)}")
+        return None
+    
     # Check if SFDX is installed and authorized
     check_sfdx_installed()
     
@@ -126,80 +715,22 @@ def search_flows_with_tooling_api(search_term, threshold=DEFAULT_SIMILARITY_THRE
     connection = get_tooling_api_connection()
     if not connection:
         print("Could not establish Tooling API connection")
-        return []
-    
-    instance_url = connection["instance_url"]
-    access_token = connection["access_token"]
-    
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    }
+        return None
     
     try:
-        # Try each available API version starting from newest
-        # Most reliable approach to handle different API versions
-        api_versions = [57.0, 56.0, 55.0, 54.0, 53.0, 52.0, 51.0, 50.0]
-        
-        for api_version in api_versions:
-            # Try to get a list of all active flows using Tooling API
-            url = f"{instance_url}/services/data/v{api_version}/tooling/query"
-            
-            # Build query with or without status filter
-            if status_filter:
-                query = f"SELECT Id, MasterLabel, DefinitionId, Status FROM Flow WHERE Status = '{status_filter}'"
-            else:
-                query = "SELECT Id, MasterLabel, DefinitionId, Status FROM Flow"
-                
-            params = {"q": query}
-            
-            print(f"Querying flows using API v{api_version}...")
-            response = requests.get(url, headers=headers, params=params)
-            
-            # Check if this API version works
-            if response.status_code == 200:
-                print(f"Successfully connected to Tooling API using v{api_version}")
-                break
-            elif response.status_code == 404:
-                print(f"API v{api_version} not available, trying older version...")
-                continue
-            else:
-                print(f"Error with API v{api_version}: {response.status_code}")
-                print(response.text[:500])  # Show first 500 chars of error
-                continue
-        
-        else:  # This executes if the loop completes without a break
-            print("Could not find a working API version")
-            return []
-        
-        # Process the response
-        result = response.json()
+        like_terms = search_terms if prefilter else None
+        result = _query_flows_tooling_api(connection, status_filter, like_terms, use_cache)
+        if result is None:
+            return None
         
         if 'records' not in result:
             print("No flow records found in response")
-            return []
+            return None
         
         # Get all flows
         all_flows = result.get('records', [])
         print(f"Found {len(all_flows)} total flows")
-        
-        # Filter flows using fuzzy matching on MasterLabel
-        matching_flows = []
-        for flow in all_flows:
-            if 'MasterLabel' in flow and fuzzy_match(search_term, flow['MasterLabel'], threshold):
-                # Create simplified flow record with just the fields we want
-                matching_flow = {
-                    'MasterLabel': flow.get('MasterLabel', ''),
-                    'DefinitionId': flow.get('DefinitionId', ''),
-                    'Status': flow.get('Status', ''),
-                    'Id': flow.get('Id', '')
-                }
-                matching_flows.append(matching_flow)
-        
-        # Sort results by MasterLabel
-        matching_flows.sort(key=lambda x: x.get('MasterLabel', ''))
-        
-        return matching_flows
+        return [flow for flow in all_flows if 'MasterLabel' in flow]
         
     except Exception as e:
         print(f"Error searching flows with Tooling API: {str(e)}")
@@ -212,191 +743,110 @@ def search_flows_with_tooling_api(search_term, threshold=DEFAULT_SIMILARITY_THRE
             
             if not result or 'result' not in result or 'records' not in result['result']:
                 print("Fallback approach failed")
-                return []
-            
-            # Process CLI results
-            flows = result['result']['records']
-            
-            # Filter flows using fuzzy matching on MasterLabel
-            matching_flows = []
-            for flow in flows:
-                if 'MasterLabel' in flow and fuzzy_match(search_term, flow['MasterLabel'], threshold):
-                    # Check status filter if provided
-                    if status_filter and flow.get('Status') != status_filter:
-                        continue
-                        
-                    # Create simplified flow record with just the fields we want
-                    matching_flow = {
-                        'MasterLabel': flow.get('MasterLabel', ''),
-                        'Id': flow.get('Id', ''),
-                        'Status': flow.get('Status', ''),
-                        # No DefinitionId available in this approach
-                        'DefinitionId': 'N/A'
-                    }
-                    matching_flows.append(matching_flow)
-            
-            # Sort results by MasterLabel
-            matching_flows.sort(key=lambda x: x.get('MasterLabel', ''))
+                return None
             
-            return matching_flows
+            # Process CLI results, applying the status filter if provided.
+            # No DefinitionId available in this approach.
+            return [
+                dict(flow, DefinitionId='N/A') for flow in result['result']['records']
+                if 'MasterLabel' in flow and not (status_filter and flow.get('Status') != status_filter)
+            ]
             
         except Exception as e2:
             print(f"Fallback approach failed: {str(e2)}")
-            return []
+            return None
 
-def search_flows_multi_terms(search_terms, threshold=DEFAULT_SIMILARITY_THRESHOLD, status_filter=None):
-    """Search for flows containing fuzzy matches to multiple search terms in the MasterLabel field
+def _match_flows_by_id(search_terms, threshold=DEFAULT_SIMILARITY_THRESHOLD, status_filter=None,
+                       prefilter=False, use_cache=True):
+    """Match flows against several search terms in a single pass, keeping each flow once
     
-    This is a more efficient version that queries flows only once for multiple terms.
+    Flows are identified by DefinitionId, or by Id when the DefinitionId is
+    not available (the CLI fallback reports it as 'N/A').
     
     Args:
         search_terms: List of terms to search for in flow labels
         threshold: Minimum similarity score for fuzzy matching (0-1)
         status_filter: Optional filter for flow status (e.g., 'Active', 'Draft')
+        prefilter: Only fetch flows whose label contains one of the search terms
+        use_cache: Whether to reuse the on-disk flow list if it is current
         
     Returns:
-        Dictionary mapping search terms to lists of matching flow dictionaries
+        Tuple of (flows, matched_terms). flows maps each matching flow's ID to
+        its record, scored with its best match, in the order first seen.
+        matched_terms maps the same IDs to {search term: score} dictionaries.
     """
-    # Check if SFDX is installed and authorized
-    check_sfdx_installed()
-    
-    # Get Tooling API connection details
-    connection = get_tooling_api_connection()
-    if not connection:
-        print("Could not establish Tooling API connection")
-        return {term: [] for term in search_terms}
+    flows_by_id = {}
+    matched_terms = {}
     
-    instance_url = connection["instance_url"]
-    access_token = connection["access_token"]
+    flows = _fetch_flows(search_terms, status_filter, prefilter, use_cache)
+    if flows is None:
+        return flows_by_id, matched_terms
     
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    }
-    
-    # Initialize results dictionary
-    results = {term: [] for term in search_terms}
+    # Score every search term against every MasterLabel at once
+    labels = [flow['MasterLabel'] or '' for flow in flows]
+    term_matches = _match_terms_to_labels(search_terms, labels, threshold)
     
-    try:
-        # Try each available API version starting from newest
-        api_versions = [57.0, 56.0, 55.0, 54.0, 53.0, 52.0, 51.0, 50.0]
-        
-        for api_version in api_versions:
-            # Try to get a list of all flows using Tooling API
-            url = f"{instance_url}/services/data/v{api_version}/tooling/query"
-            
-            # Build query with or without status filter
-            if status_filter:
-                query = f"SELECT Id, MasterLabel, DefinitionId, Status FROM Flow WHERE Status = '{status_filter}'"
-            else:
-                query = "SELECT Id, MasterLabel, DefinitionId, Status FROM Flow"
-                
-            params = {"q": query}
-            
-            print(f"Querying flows using API v{api_version}...")
-            response = requests.get(url, headers=headers, params=params)
-            
-            # Check if this API version works
-            if response.status_code == 200:
-                print(f"Successfully connected to Tooling API using v{api_version}")
-                break
-            elif response.status_code == 404:
-                print(f"API v{api_version} not available, trying older version...")
-                continue
-            else:
-                print(f"Error with API v{api_version}: {response.status_code}")
-                print(response.text[:500])  # Show first 500 chars of error
-                continue
-        
-        else:  # This executes if the loop completes without a break
-            print("Could not find a working API version")
-            return {term: [] for term in search_terms}
-        
-        # Process the response
-        result = response.json()
-        
-        if 'records' not in result:
-            print("No flow records found in response")
-            return {term: [] for term in search_terms}
-        
-        # Get all flows
-        all_flows = result.get('records', [])
-        print(f"Found {len(all_flows)} total flows")
+    for search_term, flow_matches in zip(search_terms, term_matches):
+        term_count = 0
         
-        # For each search term, find matching flows
-        for search_term in search_terms:
-            matching_flows = []
+        for j, score in flow_matches:
+            flow = flows[j]
+            definition_id = flow.get('DefinitionId', '')
+            flow_id = definition_id if definition_id and definition_id != 'N/A' else flow.get('Id', '')
             
-            # Filter flows using fuzzy matching on MasterLabel
-            for flow in all_flows:
-                if 'MasterLabel' in flow and fuzzy_match(search_term, flow['MasterLabel'], threshold):
-                    # Create simplified flow record with just the fields we want
-                    matching_flow = {
-                        'MasterLabel': flow.get('MasterLabel', ''),
-                        'DefinitionId': flow.get('DefinitionId', ''),
-                        'Status': flow.get('Status', ''),
-                        'Id': flow.get('Id', '')
-                    }
-                    matching_flows.append(matching_flow)
-            
-            # Sort results by MasterLabel
-            matching_flows.sort(key=lambda x: x.get('MasterLabel', ''))
-            
-            # Store in results dictionary
-            results[search_term] = matching_flows
-            print(f"Found {len(matching_flows)} flows matching '{search_term}'")
+            if flow_id not in flows_by_id:
+                # Create simplified flow record with just the fields we want
+                flows_by_id[flow_id] = {
+                    'MasterLabel': flow.get('MasterLabel', ''),
+                    'DefinitionId': definition_id,
+                    'Status': flow.get('Status', ''),
+                    'Id': flow.get('Id', ''),
+                    'Score': score
+                }
+                matched_terms[flow_id] = {}
+            elif score > flows_by_id[flow_id]['Score']:
+                flows_by_id[flow_id]['Score'] = score
             
-        return results
+            # Several versions of a flow share its DefinitionId; count the flow once
+            if search_term not in matched_terms[flow_id]:
+                term_count += 1
+            matched_terms[flow_id][search_term] = max(score, matched_terms[flow_id].get(search_term, 0))
         
-    except Exception as e:
-        print(f"Error searching flows with Tooling API: {str(e)}")
+        print(f"Found {term_count} flows matching '{search_term}'")
+    
+    return flows_by_id, matched_terms
+
+def search_flows_multi_terms(search_terms, threshold=DEFAULT_SIMILARITY_THRESHOLD, status_filter=None,
+                             prefilter=False, use_cache=True):
+    """Search for flows containing fuzzy matches to multiple search terms in the MasterLabel field
+    
+    This is a more efficient version that queries flows only once for multiple terms.
+    
+    Args:
+        search_terms: List of terms to search for in flow labels
+        threshold: Minimum similarity score for fuzzy matching (0-1)
+        status_filter: Optional filter for flow status (e.g., 'Active', 'Draft')
+        prefilter: Only fetch flows whose label contains one of the search
+            terms (SOQL LIKE filters). Much less data on large orgs, but
+            fuzzy-only matches are not found.
+        use_cache: Whether to reuse the on-disk flow list if it is current
         
-        # Fallback to CLI approach
-        print("Trying fallback approach...")
-        try:
-            cmd = "sfdx force:data:soql:query -q \"SELECT Id, MasterLabel, Status FROM Flow\" --json"
-            result = run_sfdx_command(cmd)
-            
-            if not result or 'result' not in result or 'records' not in result['result']:
-                print("Fallback approach failed")
-                return {term: [] for term in search_terms}
-            
-            # Process CLI results
-            flows = result['result']['records']
-            
-            # For each search term, find matching flows
-            for search_term in search_terms:
-                matching_flows = []
-                
-                # Filter flows using fuzzy matching on MasterLabel
-                for flow in flows:
-                    if 'MasterLabel' in flow and fuzzy_match(search_term, flow['MasterLabel'], threshold):
-                        # Check status filter if provided
-                        if status_filter and flow.get('Status') != status_filter:
-                            continue
-                            
-                        # Create simplified flow record with just the fields we want
-                        matching_flow = {
-                            'MasterLabel': flow.get('MasterLabel', ''),
-                            'Id': flow.get('Id', ''),
-                            'Status': flow.get('Status', ''),
-                            # No DefinitionId available in this approach
-                            'DefinitionId': 'N/A'
-                        }
-                        matching_flows.append(matching_flow)
-                
-                # Sort results by MasterLabel
-                matching_flows.sort(key=lambda x: x.get('MasterLabel', ''))
-                
-                # Store in results dictionary
-                results[search_term] = matching_flows
-                print(f"Found {len(matching_flows)} flows matching '{search_term}'")
-            
-            return results
-            
-        except Exception as e2:
-            print(f"Fallback approach failed: {str(e2)}")
-            return {term: [] for term in search_terms}
+    Returns:
+        Dictionary mapping search terms to lists of matching flow dictionaries
+    """
+    flows_by_id, matched_terms = _match_flows_by_id(search_terms, threshold, status_filter, prefilter, use_cache)
+    
+    # Each term gets its own copy of a flow's record, with that term's score
+    results = {term: [] for term in search_terms}
+    for flow_id, term_scores in matched_terms.items():
+        for search_term, score in term_scores.items():
+            results[search_term].append(dict(flows_by_id[flow_id], Score=score))
+    
+    # Sort results by MasterLabel
+    for matching_flows in results.values():
+        matching_flows.sort(key=lambda x: x.get('MasterLabel', ''))
+    
+    return results
 
 def search_flows_multi_terms_summary(search_terms, threshold=DEFAULT_SIMILARITY_THRESHOLD, status_filter=None):
     """Search for flows containing multiple terms and return which terms were found
@@ -409,15 +859,14 @@ def search_flows_multi_terms_summary(search_terms, threshold=DEFAULT_SIMILARITY_
     Returns:
         Dictionary mapping "Term_{term}" to boolean existence status
     """
-    # Get detailed results
-    detailed_results = search_flows_multi_terms(search_terms, threshold, status_filter)
+    # Only whether each term matched is needed, so skip building flow lists
+    flows = _fetch_flows(search_terms, status_filter)
+    if flows is None:
+        return {f"Flow_{term}": False for term in search_terms}
     
-    # Convert to simple yes/no results
-    summary_results = {}
-    for term, matching_flows in detailed_results.items():
-        summary_results[f"Flow_{term}"] = len(matching_flows) > 0
-        
-    return summary_results
+    labels = [flow['MasterLabel'] or '' for flow in flows]
+    found = _any_match_per_term(labels, search_terms, threshold)
+    return {f"Flow_{term}": found[term] for term in search_terms}
 
 def parse_args():
     """Parse command-line arguments"""
@@ -425,8 +874,15 @@ def parse_args():
     parser.add_argument('search_term', type=str, help='Text to search for in flow labels (comma-separated for multiple terms)')
     parser.add_argument('--threshold', '-t', type=float, default=DEFAULT_SIMILARITY_THRESHOLD,
                         help=f'Minimum similarity score for fuzzy matching (0-1, default: {DEFAULT_SIMILARITY_THRESHOLD})')
-    parser.add_argument('--status', '-s', type=str, choices=['Active', 'Draft', 'Obsolete', 'InvalidDraft'],
+    parser.add_argument('--status', '-s', type=str, choices=FLOW_STATUSES,
                         help='Filter flows by status')
+    parser.add_argument('--prefilter', '-p', action='store_true',
+                        help='Only fetch flows whose label contains a search term (faster on large orgs, '
+                             'but skips fuzzy-only matches)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always download the full flow list instead of using the on-disk cache')
+    parser.add_argument('--top', '-k', type=int,
+                        help='Only show the K flows with the highest similarity scores')
     parser.add_argument('--output', '-o', type=str, choices=['text', 'json', 'csv'], default='text',
                         help='Output format (default: text)')
     parser.add_argument('--output-file', '-f', type=str, 
@@ -453,25 +909,14 @@ def main():
                 print(f"Filtering for flows with status: {status_filter}")
             print(f"Using similarity threshold: {threshold}")
             
-            # Search for flows matching multiple terms
-            results_by_term = search_flows_multi_terms(search_terms, threshold, status_filter)
-            
-            # Combine all matching flows into a single list
-            all_matching_flows = []
-            for term, flows in results_by_term.items():
-                all_matching_flows.extend(flows)
-            
-            # Remove duplicates (same flow might match multiple terms)
-            unique_flows = {}
-            for flow in all_matching_flows:
-                # Use DefinitionId or Id as key to identify unique flows
-                key = flow.get('DefinitionId') or flow.get('Id')
-                if key:
-                    unique_flows[key] = flow
-            
-            matching_flows = list(unique_flows.values())
-            # Sort by MasterLabel
-            matching_flows.sort(key=lambda x: x.get('MasterLabel', ''))
+            # Search for flows matching multiple terms; each flow comes back
+            # once even if it matched several terms
+            flows_by_id, _ = _match_flows_by_id(search_terms, threshold, status_filter, args.prefilter,
+                                                not args.no_cache)
+            matching_flows = list(flows_by_id.values())
+            # Sort by MasterLabel (--top ranks by score instead, below)
+            if not args.top:
+                matching_flows.sort(key=lambda x: x.get('MasterLabel', ''))
         else:
             print(f"Searching for flows with labels similar to: '{search_term}'")
             if status_filter:
@@ -479,7 +924,8 @@ def main():
             print(f"Using similarity threshold: {threshold}")
             
             # Search for flows with the single term
-            matching_flows = search_flows_with_tooling_api(search_term, threshold, status_filter)
+            matching_flows = search_flows_with_tooling_api(search_term, threshold, status_filter, args.prefilter,
+                                                           not args.no_cache)
         
         if not matching_flows:
             print("No matching flows found")
@@ -487,9 +933,17 @@ def main():
         
         print(f"Found {len(matching_flows)} matching flows")
         
+        # Keep only the closest matches, best first
+        if args.top:
+            matching_flows = heapq.nlargest(args.top, matching_flows, key=itemgetter('Score'))
+        
         # Format and output results
         if output_format == 'json':
-            output = json.dumps(matching_flows, indent=2)
+            # Scores are only used for ranking, so leave them out of the output
+            output = json.dumps(
+                [{field: value for field, value in flow.items() if field != 'Score'} for flow in matching_flows],
+                indent=2
+            )
         elif output_format == 'csv':
             import csv
             import io
@@ -501,23 +955,25 @@ def main():
             writer.writerow(['MasterLabel', 'DefinitionId', 'Status', 'Id'])
             
             # Write flow data
-            for flow in matching_flows:
-                writer.writerow([
-                    flow.get('MasterLabel', ''),
-                    flow.get('DefinitionId', ''),
-                    flow.get('Status', ''),
-                    flow.get('Id', '')
-                ])
+            writer.writerows(
+                [flow.get('MasterLabel', ''), flow.get('DefinitionId', ''), flow.get('Status', ''), flow.get('Id', '')]
+                for flow in matching_flows
+            )
             
             output = output_buffer.getvalue()
         else:  # text format
-            output = "Matching Flows:\n"
-            output += "-" * 80 + "\n"
-            output += f"{'MasterLabel':<40} {'Status':<15} {'DefinitionId':<36}\n"
-            output += "-" * 80 + "\n"
-            
-            for flow in matching_flows:
-                output += f"{flow.get('MasterLabel', ''):<40} {flow.get('Status', ''):<15} {flow.get('DefinitionId', ''):<36}\n"
+            # Build the lines in a list and join once, rather than growing a string
+            lines = [
+                "Matching Flows:",
+                "-" * 80,
+                f"{'MasterLabel':<40} {'Status':<15} {'DefinitionId':<36}",
+                "-" * 80
+            ]
+            lines.extend(
+                f"{flow.get('MasterLabel', ''):<40} {flow.get('Status', ''):<15} {flow.get('DefinitionId', ''):<36}"
+                for flow in matching_flows
+            )
+            output = "\n".join(lines) + "\n"
         
         # Output results
         if output_file:
@@ -5,7 +5,32 @@ import json
 import sys
 import requests
 import os
+import re
+import time
+import argparse
 from typing import Dict, Any, Optional, Tuple
+from requests.adapters import HTTPAdapter
+
+import sf_org_config
+
+# Where check results and the working auth command are cached between runs
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".sfdcaudit_cache")
+
+# How long a cached Campaign Influence check stays valid, in seconds
+CACHE_TTL_SECONDS = 3600
+
+# Commands that display the default org, old CLI first
+AUTH_COMMANDS = [
+    "sfdx force:org:display --json",
+    "sf org display --json"
+]
+
+# Shared HTTP session so REST calls reuse pooled keep-alive connections
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# (instance_url, access_token) once retrieved, so the org is only displayed once per process
+_auth_details: Optional[Tuple[str, str]] = None
 
 def run_sfdx(cmd: str) -> Optional[Dict[str, Any]]:
     """Execute an SFDX command and return the parsed JSON response.
@@ -44,19 +69,57 @@ def run_sfdx(cmd: str) -> Optional[Dict[str, Any]]:
         print(f"Exception: {str(e)}")
         return None
 
+def _load_cache_file(filename: str) -> Optional[Dict[str, Any]]:
+    """Load a JSON file from the cache directory, or None if it is missing or unreadable."""
+    try:
+        with open(os.path.join(CACHE_DIR, filename), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_cache_file(filename: str, data: Dict[str, Any]) -> None:
+    """Write a JSON file to the cache directory, warning instead of failing."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(os.path.join(CACHE_DIR, filename), 'w') as f:
+            json.dump(data, f, indent=2)
+    except OSError as e:
+        print(f"Could not write cache file {filename}: {str(e)}")
+
+def _check_cache_filename(instance_url: str) -> str:
+    """Name of the cache file holding the Campaign Influence check for an org."""
+    org_key = re.sub(r'\W+', '_', instance_url)
+    return f"campaign_influence_{org_key}.json"
+
+def _load_cached_check(instance_url: str) -> Optional[Dict[str, Any]]:
+    """Return the cached Campaign Influence result for an org, or None if there is no valid one."""
+    cached = _load_cache_file(_check_cache_filename(instance_url))
+    if not cached or time.time() - cached.get("checked_at", 0) >= CACHE_TTL_SECONDS:
+        return None
+    print(f"Using cached result from {int((time.time() - cached['checked_at']) // 60)} minutes ago (use --force to re-check)")
+    return cached["result"]
+
 def get_org_auth_details() -> Tuple[Optional[Tuple[str, str]], Optional[str]]:
     """Get org authentication details (instance URL and access token).
     
+    The details are cached after the first successful lookup, and the command
+    that worked is remembered so later runs try it first.
+    
     Returns:
         Tuple of (auth_tuple, error_message) where auth_tuple is (instance_url, access_token) or None
     """
+    global _auth_details
+    if _auth_details is not None:
+        return _auth_details, None
+    
     print("Getting org authentication details...")
     
-    # Try both the old and new SFDX commands
-    commands = [
-        "sfdx force:org:display --json",
-        "sf org display --json"
-    ]
+    # Try both the old and new SFDX commands, starting with the one that worked last time
+    commands = list(AUTH_COMMANDS)
+    last_command = (_load_cache_file("auth_command.json") or {}).get("command")
+    if last_command in commands:
+        commands.remove(last_command)
+        commands.insert(0, last_command)
     
     for cmd in commands:
         print(f"Trying command: {cmd}")
@@ -69,7 +132,18 @@ def get_org_auth_details() -> Tuple[Optional[Tuple[str, str]], Optional[str]]:
             
             if instance_url and access_token:
                 print(f"Successfully retrieved authentication for {instance_url}")
-                return (instance_url, access_token), None
+                _auth_details = (instance_url, access_token)
+                if cmd != last_command:
+                    _save_cache_file("auth_command.json", {"command": cmd})
+                
+                # Remember which instance the username is on, so main can find
+                # the cached check next time before displaying the org
+                username = auth_result['result'].get('username')
+                instance_urls = _load_cache_file("instance_urls.json") or {}
+                if username and instance_urls.get(username) != instance_url:
+                    instance_urls[username] = instance_url
+                    _save_cache_file("instance_urls.json", instance_urls)
+                return _auth_details, None
     
     # If we get here, none of the commands worked
     return None, "Could not retrieve Salesforce authentication. Make sure you're authenticated and a default org is set."
@@ -83,46 +157,62 @@ def save_report(results: Dict[str, Any], filename: str = "campaign_influence_set
     except Exception as e:
         print(f"Error saving results: {str(e)}")
 
-def check_campaign_influence(instance_url: str, access_token: str) -> Dict[str, Any]:
+def check_campaign_influence(instance_url: str, access_token: str, force: bool = False) -> Dict[str, Any]:
     """Check Campaign Influence by directly querying CampaignInfluenceModel.
     
+    A definite answer is cached per instance URL for CACHE_TTL_SECONDS, so
+    repeated audit runs skip the query.
+    
     Args:
         instance_url: Salesforce instance URL
         access_token: Salesforce access token
+        force: Query the org even if a cached result is still valid
         
     Returns:
         Dictionary indicating if Campaign Influence is enabled
     """
     print("\nChecking Campaign Influence...")
     
-    headers = {
+    cache_filename = _check_cache_filename(instance_url)
+    if not force:
+        cached = _load_cached_check(instance_url)
+        if cached is not None:
+            return cached
+    
+    _session.headers.update({
         "Authorization": f"Bearer {access_token}",
         "Content-Type": "application/json"
-    }
+    })
     
     try:
         # Query for CampaignInfluenceModel to check if it exists
         query_url = f"{instance_url}/services/data/v57.0/query?q=SELECT+Id+FROM+CampaignInfluenceModel+LIMIT+1"
         print(f"Querying CampaignInfluenceModel: {query_url}")
         
-        model_response = requests.get(query_url, headers=headers)
+        model_response = _session.get(query_url)
         
         if model_response.status_code == 200:
             # CampaignInfluenceModel exists
             model_result = model_response.json()
             has_model_records = model_result.get('totalSize', 0) > 0
             
-            return {
+            result = {
                 "campaign_influence_enabled": True
             }
+            _save_cache_file(cache_filename, {"checked_at": time.time(), "result": result})
+            return result
         else:
             print(f"Error or CampaignInfluenceModel object does not exist: {model_response.status_code}")
             print(f"Response: {model_response.text[:200]}")
             
             # If we get here, CampaignInfluenceModel doesn't exist or is not accessible
-            return {
+            result = {
                 "campaign_influence_enabled": False
             }
+            # Only cache a definite "object doesn't exist", not auth or server errors
+            if model_response.status_code in (400, 404):
+                _save_cache_file(cache_filename, {"checked_at": time.time(), "result": result})
+            return result
         
     except Exception as e:
         print(f"Error checking Campaign Influence: {str(e)}")
@@ -130,10 +220,24 @@ def check_campaign_influence(instance_url: str, access_token: str) -> Dict[str,
             "campaign_influence_enabled": False
         }
 
-def main():
-    """Main function to check Campaign Influence settings."""
+def main(force: bool = False):
+    """Main function to check Campaign Influence settings.
+    
+    Args:
+        force: Re-check the org even if a cached result is still valid
+    """
     print("\n===== CHECKING CAMPAIGN INFLUENCE SETTINGS =====\n")
     
+    # A cached result for the default org avoids starting the CLI at all. The
+    # org's instance URL is known if an earlier run displayed the same username.
+    username = sf_org_config.get_target_org_username()
+    instance_url = (_load_cache_file("instance_urls.json") or {}).get(username) if username else None
+    if instance_url and not force:
+        results = _load_cached_check(instance_url)
+        if results is not None:
+            save_report(results)
+            return results
+    
     # Try to get org auth details
     auth_details, error_message = get_org_auth_details()
     
@@ -150,11 +254,14 @@ def main():
     instance_url, access_token = auth_details
     
     # Check Campaign Influence directly
-    results = check_campaign_influence(instance_url, access_token)
+    results = check_campaign_influence(instance_url, access_token, force)
     
     # Save results to JSON file
     save_report(results)
     return results
 
 if __name__ == '__main__':
-    main() 
+    parser = argparse.ArgumentParser(description='Check whether Campaign Influence is enabled in the default org')
+    parser.add_argument('--force', action='store_true',
+                        help=f'Ignore cached results younger than {CACHE_TTL_SECONDS // 60} minutes')
+    main(parser.parse_args().force) 
@@ -6,16 +6,118 @@ import argparse
 import sys
 import difflib
 import re
+import hashlib
+import os
+import time
+import shutil
+from collections import Counter
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+
+# Try to import rapidfuzz - we'll use its C++ scorers for fuzzy matching if available
+try:
+    from rapidfuzz import fuzz, process
+    import numpy as np
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# Try to import python-Levenshtein - without rapidfuzz, its C ratio is a much faster fallback than difflib
+try:
+    from Levenshtein import ratio as levenshtein_ratio
+    HAS_LEVENSHTEIN = True
+except ImportError:
+    HAS_LEVENSHTEIN = False
+
+# Try to import orjson - we'll use it to parse and write large JSON payloads if available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # The minimum similarity score (0-1) required for a fuzzy match
 DEFAULT_SIMILARITY_THRESHOLD = 0.6
 
+# Slack when comparing 0-100 scores with threshold * 100, which is not exact
+# for every threshold (see search_fields)
+SCORE_EPSILON = 1e-4
+
+# Cached SFDX results live here, one file per org and command
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".sfdcaudit_cache")
+
+# How long a cached SFDX result stays valid, in seconds
+CACHE_TTL_SECONDS = 3600
+
+# Set to False (--no-cache) to always query the org
+USE_CACHE = True
+
+# Shared HTTP session so REST calls reuse pooled keep-alive connections,
+# retrying transient connection failures and 5xx responses with backoff
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                                       max_retries=Retry(total=3, backoff_factor=0.3,
+                                                         status_forcelist=(500, 502, 503, 504))))
+
+# Maximum number of object describes to run at the same time
+MAX_DESCRIBE_WORKERS = 8
+
+# Resolved CLI executable paths, keyed by name (only executables that were found)
+_executable_paths = {}
+
+# Whether check_sfdx_installed has already succeeded in this process
+_sfdx_checked = False
+
+# Connection details from the first successful org display (see _get_tooling_api_connection)
+_connection = None
+
+# Object API names from the first successful listing (see _list_sobjects)
+_sobjects = None
+
+def _loads_json(data):
+    """Parse a JSON str or bytes payload, using orjson if available
+    
+    orjson's decode errors subclass json.JSONDecodeError, so callers can catch
+    that either way.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps_json(data):
+    """Serialize data as JSON indented by two spaces, using orjson if available"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
+def _find_executable(name):
+    """Return the full path of a CLI executable, or the name if it isn't on PATH
+    
+    Commands run without a shell, so this is needed to find wrappers such as
+    sfdx.cmd on Windows. Paths that were found are remembered for the rest of
+    the process.
+    """
+    path = _executable_paths.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is None:
+            return name
+        _executable_paths[name] = path
+    return path
+
 def run_sfdx_command(command, capture_json=True):
-    """Run an SFDX command and return the result"""
+    """Run an SFDX command and return the result
+    
+    Args:
+        command: Command as an argument list, e.g. ["sfdx", "force:org:display", "--json"]
+        capture_json: If True, parse the output as JSON
+    """
     try:
         result = subprocess.run(
-            command,
-            shell=True,
+            [_find_executable(command[0])] + command[1:],
+            shell=False,
             check=False,  # Don't raise exception on non-zero return code
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -25,32 +127,36 @@ def run_sfdx_command(command, capture_json=True):
         )
         
         if result.returncode != 0:
-            print(f"Error executing command: {command}")
+            print(f"Error executing command: {' '.join(command)}")
             print(f"Error: {result.stderr}")
             return None
         
         if capture_json:
             try:
-                return json.loads(result.stdout)
+                return _loads_json(result.stdout)
             except json.JSONDecodeError as e:
-                print(f"Error parsing JSON from command: {command}")
+                print(f"Error parsing JSON from command: {' '.join(command)}")
                 print(f"Error details: {str(e)}")
                 print(f"Output (first 1000 chars): {result.stdout[:1000]}")
                 return None
         else:
             return result.stdout
     except Exception as e:
-        print(f"Error executing command: {command}")
+        print(f"Error executing command: {' '.join(command)}")
         print(f"Exception: {str(e)}")
         return None
 
 def check_sfdx_installed():
-    """Check if SFDX CLI is installed and authorized"""
+    """Check if SFDX CLI is installed and authorized (once per process)"""
+    global _sfdx_checked
+    if _sfdx_checked:
+        return True
+    
     try:
         # Check if SFDX is installed
         subprocess.run(
-            "sfdx --version",
-            shell=True,
+            [_find_executable("sfdx"), "--version"],
+            shell=False,
             check=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -58,14 +164,15 @@ def check_sfdx_installed():
         )
         
         # Check if there's an authorized org
-        result = run_sfdx_command("sfdx force:org:display --json")
+        result = run_sfdx_command(["sfdx", "force:org:display", "--json"])
         if not result or 'result' not in result:
             print("No authorized Salesforce org found.")
             print("Please authorize an org using: sfdx force:auth:web:login")
             sys.exit(1)
             
+        _sfdx_checked = True
         return True
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         print("SFDX CLI not found or not properly installed.")
         print("Please install SFDX CLI from: https://developer.salesforce.com/tools/sfdxcli")
         sys.exit(1)
@@ -73,19 +180,242 @@ def check_sfdx_installed():
         print(f"Error checking SFDX installation: {e}")
         sys.exit(1)
 
-def fuzzy_match(search_term, text, threshold=DEFAULT_SIMILARITY_THRESHOLD):
-    """Check if the search term fuzzy matches the text"""
+def _get_tooling_api_connection():
+    """Get connection information for the Tooling API
+    
+    The org is only displayed until that succeeds; later calls return the
+    saved connection.
+    """
+    global _connection
+    if _connection is not None:
+        return _connection
+    
+    try:
+        # Get org authentication details
+        auth_result = run_sfdx_command(["sfdx", "force:org:display", "--json"])
+        if not auth_result or 'result' not in auth_result:
+            print("Failed to get org authentication details")
+            return None
+        
+        # Extract instance URL and access token
+        instance_url = auth_result["result"].get("instanceUrl")
+        access_token = auth_result["result"].get("accessToken")
+        
+        if not instance_url or not access_token:
+            print("Missing instanceUrl or accessToken in SFDX response")
+            return None
+            
+        _connection = {
+            "instance_url": instance_url,
+            "access_token": access_token
+        }
+        return _connection
+    except Exception as e:
+        print(f"Error getting Tooling API connection: {str(e)}")
+        return None
+
+def _sf_rest(path, params=None):
+    """Call a Salesforce REST API resource directly, without starting the CLI
+    
+    Args:
+        path: Resource path below /services/data/v57.0/, e.g. "sobjects/"
+        params: Optional query string parameters
+        
+    Returns:
+        Parsed JSON response, or None if the request failed
+    """
+    connection = _get_tooling_api_connection()
+    if not connection:
+        return None
+    
+    _session.headers.update({
+        "Authorization": f"Bearer {connection['access_token']}",
+        "Content-Type": "application/json"
+    })
+    
+    try:
+        url = f"{connection['instance_url']}/services/data/v57.0/{path}"
+        response = _session.get(url, params=params)
+        if response.status_code == 200:
+            return _loads_json(response.content)
+        print(f"Error calling {path}: HTTP {response.status_code}")
+    except Exception as e:
+        print(f"Error calling {path}: {str(e)}")
+    
+    return None
+
+def _command_cache_path(command):
+    """Return the cache file for a command's result against the connected org
+    
+    Files are keyed by the org's instance URL, so results from different orgs
+    never mix. Returns None if there is no connection to key by.
+    """
+    connection = _get_tooling_api_connection()
+    if not connection:
+        return None
+    org_hash = hashlib.sha1(connection["instance_url"].encode('utf-8')).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, org_hash + "_" + re.sub(r'[^A-Za-z0-9.@-]+', '_', command) + ".json")
+
+def _load_cached_result(command):
+    """Load a cached command result if it is younger than CACHE_TTL_SECONDS, else None"""
+    if not USE_CACHE:
+        return None
+    path = _command_cache_path(command)
+    if path is None:
+        return None
+    try:
+        if time.time() - os.path.getmtime(path) >= CACHE_TTL_SECONDS:
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_cached_result(command, result):
+    """Save a command result to the cache, warning instead of failing"""
+    path = _command_cache_path(command)
+    if path is None:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(result, f)
+    except OSError as e:
+        print(f"Could not write cache file for {command}: {str(e)}")
+
+def fuzzy_match(search_term, text, threshold=DEFAULT_SIMILARITY_THRESHOLD, term_lower=None, text_lower=None):
+    """Check if the search term fuzzy matches the text
+    
+    Scores use partial matching: a short term is compared with the best
+    aligned part of a longer object name, so a misspelled word inside a
+    name such as Attribution_Model__c still scores high.
+    
+    Callers comparing the same strings many times can pass their lowercased
+    forms as term_lower/text_lower so they are only computed once.
+    """
     # None check
     if text is None:
         return False
+    
+    if term_lower is None:
+        term_lower = search_term.lower()
+    if text_lower is None:
+        text_lower = text.lower()
         
     # Simple case: direct substring match
-    if search_term.lower() in text.lower():
+    if term_lower in text_lower:
         return True
     
-    # Advanced case: fuzzy matching using difflib
-    similarity = difflib.SequenceMatcher(None, search_term.lower(), text.lower()).ratio()
-    return similarity >= threshold
+    # Advanced case: fuzzy matching using rapidfuzz, which can stop early
+    # once the score can no longer reach the cutoff
+    if HAS_RAPIDFUZZ:
+        score_cutoff = max(threshold * 100 - SCORE_EPSILON, 0)
+        score = fuzz.partial_ratio(term_lower, text_lower, score_cutoff=score_cutoff)
+        return score >= score_cutoff
+    
+    # Fallback: fuzzy matching using python-Levenshtein or difflib
+    return _partial_similarity_ratio(term_lower, text_lower) >= threshold
+
+def _similarity_ratio(a, b):
+    """Similarity of two strings (0-1) for when rapidfuzz isn't available
+    
+    python-Levenshtein's ratio is the same indel-based score as fuzz.ratio,
+    computed in C; difflib's SequenceMatcher is the pure-Python last resort.
+    """
+    if HAS_LEVENSHTEIN:
+        return levenshtein_ratio(a, b)
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+def _partial_similarity_ratio(a, b):
+    """Best similarity (0-1) of the shorter string against a part of the longer one
+    
+    Fallback for fuzz.partial_ratio: the shorter string is scored against
+    the windows of the longer one that its matching blocks line it up with.
+    """
+    shorter, longer = (a, b) if len(a) <= len(b) else (b, a)
+    if len(shorter) == len(longer):
+        return _similarity_ratio(shorter, longer)
+    
+    best = 0.0
+    for block in difflib.SequenceMatcher(None, shorter, longer, autojunk=False).get_matching_blocks():
+        start = max(block.b - block.a, 0)
+        best = max(best, _similarity_ratio(shorter, longer[start:start + len(shorter)]))
+    return best
+
+def _match_terms_to_objects(search_terms, objects, threshold=DEFAULT_SIMILARITY_THRESHOLD, objects_lower=None):
+    """Find which objects each search term fuzzy matches
+    
+    Uses the same rules as fuzzy_match. With rapidfuzz, all terms are scored
+    against all objects in a single process.cdist call (C++, multi-threaded)
+    instead of one Python-level comparison per pair.
+    
+    Args:
+        search_terms: List of terms to search for
+        objects: List of object names to search in
+        threshold: Minimum similarity score for fuzzy matching (0-1)
+        objects_lower: Optional precomputed lowercased object names
+        
+    Returns:
+        List with, for each search term, the sorted indices of matching objects
+    """
+    # Lowercase every term and object once, not once per comparison
+    terms_lower = [term.lower() for term in search_terms]
+    if objects_lower is None:
+        objects_lower = [obj.lower() for obj in objects]
+    
+    if not HAS_RAPIDFUZZ:
+        # Character counts per object, built once and shared by every term
+        object_counts = [Counter(obj) for obj in objects_lower]
+        return [
+            _match_term_without_rapidfuzz(term_lower, objects_lower, object_counts, threshold)
+            for term_lower in terms_lower
+        ]
+    
+    score_cutoff = max(threshold * 100 - SCORE_EPSILON, 0)
+    scores = process.cdist(terms_lower, objects_lower, scorer=fuzz.partial_ratio,
+                           score_cutoff=score_cutoff, workers=-1)
+    
+    matches = []
+    for i, term_lower in enumerate(terms_lower):
+        hits = set(np.flatnonzero(scores[i] >= score_cutoff).tolist())
+        # Substring matches always count, whatever their ratio
+        hits.update(j for j, obj in enumerate(objects_lower) if term_lower in obj)
+        matches.append(sorted(hits))
+    return matches
+
+def _match_term_without_rapidfuzz(term_lower, objects_lower, object_counts, threshold):
+    """Find the indices of the objects one lowercased term matches, without rapidfuzz
+    
+    A partial score compares the shorter string (length ls) with a window
+    (length lw) of the longer one: 2*M/(ls+lw), where M, the number of
+    matching characters, is at most lw and at most the number C of characters
+    the two strings share. That is at most 2*C/(ls+C), so objects below the
+    threshold on that bound are skipped without being scored.
+    """
+    term_counts = Counter(term_lower)
+    la = len(term_lower)
+    hits = []
+    for j, obj_lower in enumerate(objects_lower):
+        if term_lower in obj_lower:
+            hits.append(j)
+            continue
+        shared = sum((term_counts & object_counts[j]).values())
+        if 2 * shared < threshold * (min(la, len(obj_lower)) + shared):
+            continue
+        if _partial_similarity_ratio(term_lower, obj_lower) >= threshold:
+            hits.append(j)
+    return hits
+
+def _compile_terms_pattern(search_terms):
+    """Compile a regex that finds any of the lowercased search terms as a substring
+    
+    Args:
+        search_terms: Non-empty list of terms to search for
+        
+    Returns:
+        Compiled pattern to run against lowercased object names
+    """
+    return re.compile("|".join(re.escape(term.lower()) for term in search_terms))
 
 def get_all_objects(include_custom=True, include_standard=False):
     """Get all Salesforce objects
@@ -94,13 +424,65 @@ def get_all_objects(include_custom=True, include_standard=False):
         include_custom: Whether to include custom objects
         include_standard: Whether to include standard objects
         
+    Returns:
+        List of object API names
+    """
+    sobjects = _list_sobjects()
+    
+    # Filter objects based on parameters
+    filtered_objects = []
+    for obj in sobjects:
+        # Custom objects are the ones ending in __c, as in every output column
+        is_custom = obj.endswith("__c")
+        if (include_custom and is_custom) or (include_standard and not is_custom):
+            filtered_objects.append(obj)
+    
+    return filtered_objects
+
+def _list_sobjects():
+    """Get all Salesforce objects, listed once per process
+    
+    The list comes from the REST sobjects resource, which is a single HTTPS
+    request; the CLI is only used if that request fails. A failed listing is
+    not remembered, so the next call tries again.
+    
+    Returns:
+        Tuple of object API names
+    """
+    global _sobjects
+    if _sobjects is not None:
+        return _sobjects
+    
+    cached = _load_cached_result("sobject names")
+    if cached is not None:
+        _sobjects = tuple(cached)
+        return _sobjects
+    
+    result = _sf_rest("sobjects/")
+    if result and isinstance(result.get("sobjects"), list):
+        sobjects = [
+            obj["name"] for obj in result["sobjects"]
+            if isinstance(obj, dict) and isinstance(obj.get("name"), str)
+        ]
+    else:
+        sobjects = _list_sobjects_with_cli()
+        if not sobjects:
+            return ()
+    
+    _save_cached_result("sobject names", sobjects)
+    _sobjects = tuple(sobjects)
+    return _sobjects
+
+def _list_sobjects_with_cli():
+    """Get all Salesforce objects using the SFDX CLI
+    
     Returns:
         List of object API names
     """
     # Check if SFDX is installed
     check_sfdx_installed()
     
-    cmd = "sfdx force:schema:sobject:list --json"
+    cmd = ["sfdx", "force:schema:sobject:list", "--json"]
     result = run_sfdx_command(cmd)
     
     if not result:
@@ -118,17 +500,7 @@ def get_all_objects(include_custom=True, include_standard=False):
         # Alternative format where sobjects is a key in result
         sobjects = [obj["name"] for obj in result["result"]["sobjects"] if isinstance(obj, dict) and "name" in obj]
     
-    # Filter objects based on parameters
-    filtered_objects = []
-    for obj in sobjects:
-        if not isinstance(obj, str):
-            continue
-            
-        is_custom = obj.endswith("__c")
-        if (include_custom and is_custom) or (include_standard and not is_custom):
-            filtered_objects.append(obj)
-    
-    return filtered_objects
+    return [obj for obj in sobjects if isinstance(obj, str)]
 
 def get_object_details(object_name):
     """Get detailed information about a specific object
@@ -139,7 +511,7 @@ def get_object_details(object_name):
     Returns:
         Dictionary with object details or None if not found
     """
-    cmd = f"sfdx force:schema:sobject:describe -s {object_name} --json"
+    cmd = ["sfdx", "force:schema:sobject:describe", "-s", object_name, "--json"]
     result = run_sfdx_command(cmd)
     
     if not result or 'result' not in result:
@@ -171,18 +543,26 @@ def search_objects_with_terms(search_terms, search_type="custom", use_fuzzy=Fals
     # Search each term against all objects
     results = {}
     
-    for term in search_terms:
-        matching_objects = []
-        
-        for obj_name in all_objects:
-            # Check if the object name matches the search term
-            if use_fuzzy:
-                if fuzzy_match(term, obj_name, threshold):
-                    matching_objects.append(obj_name)
-            else:
-                # Simple substring match
-                if term.lower() in obj_name.lower():
-                    matching_objects.append(obj_name)
+    # Lowercase every object name once, not once per search term
+    objects_lower = [obj_name.lower() for obj_name in all_objects]
+    
+    # Score every term against every object at once for fuzzy matching
+    if use_fuzzy:
+        term_matches = _match_terms_to_objects(search_terms, all_objects, threshold, objects_lower)
+    elif search_terms:
+        # One regex scan per object finds the objects that contain any term,
+        # so the per-term checks below only look at those
+        pattern = _compile_terms_pattern(search_terms)
+        candidates = [j for j, obj_lower in enumerate(objects_lower) if pattern.search(obj_lower)]
+    
+    for i, term in enumerate(search_terms):
+        # Check which object names match the search term
+        if use_fuzzy:
+            matching_objects = [all_objects[j] for j in term_matches[i]]
+        else:
+            # Simple substring match
+            term_lower = term.lower()
+            matching_objects = [all_objects[j] for j in candidates if term_lower in objects_lower[j]]
         
         results[term] = matching_objects
         print(f"Found {len(matching_objects)} objects matching '{term}'")
@@ -226,21 +606,19 @@ def search_custom_objects_for_attribution(search_terms, use_fuzzy=False, thresho
     custom_objects = get_all_objects(include_custom=True, include_standard=False)
     
     # Find custom objects related to the search terms
-    matching_objects = []
+    if use_fuzzy:
+        # Check for fuzzy matches, scoring all terms against all objects at once
+        matched = set()
+        for object_indices in _match_terms_to_objects(search_terms, custom_objects, threshold):
+            matched.update(object_indices)
+        return [custom_objects[j] for j in sorted(matched)]
     
-    for obj in custom_objects:
-        obj_lower = obj.lower()
-        
-        if use_fuzzy:
-            # Check for fuzzy matches
-            if any(fuzzy_match(term, obj, threshold) for term in search_terms):
-                matching_objects.append(obj)
-        else:
-            # Check for substring matches
-            if any(term.lower() in obj_lower for term in search_terms):
-                matching_objects.append(obj)
+    if not search_terms:
+        return []
     
-    return matching_objects
+    # Check for substring matches of any term with a single regex scan
+    pattern = _compile_terms_pattern(search_terms)
+    return [obj for obj in custom_objects if pattern.search(obj.lower())]
 
 def parse_args():
     """Parse command-line arguments"""
@@ -258,6 +636,8 @@ def parse_args():
                         help='File to save results to (default: output to console)')
     parser.add_argument('--details', '-d', action='store_true',
                         help='Include detailed information about matching objects')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Ignore SFDX results cached in the last {CACHE_TTL_SECONDS // 60} minutes')
     return parser.parse_args()
 
 def main():
@@ -266,6 +646,9 @@ def main():
         # Parse command-line arguments
         args = parse_args()
         
+        global USE_CACHE
+        USE_CACHE = not args.no_cache
+        
         search_term = args.search_term
         search_type = args.type
         use_fuzzy = args.fuzzy
@@ -288,22 +671,24 @@ def main():
         # Search for objects matching the terms
         results = search_objects_with_terms(search_terms, search_type, use_fuzzy, threshold)
         
-        # Combine all matching objects into a single list, removing duplicates
-        all_matching_objects = []
+        # Map each matching object to the terms it matched, in one pass;
+        # its keys are the matching objects without duplicates
+        term_map = {}
         for term, objects in results.items():
-            all_matching_objects.extend(objects)
+            for obj_name in objects:
+                term_map.setdefault(obj_name, []).append(term)
         
-        # Remove duplicates
-        unique_objects = sorted(list(set(all_matching_objects)))
+        unique_objects = sorted(term_map)
         
         # Get detailed information if requested
         object_details = {}
         if include_details:
             print("Getting detailed information for matching objects...")
-            for obj_name in unique_objects:
-                details = get_object_details(obj_name)
-                if details:
-                    object_details[obj_name] = details
+            # Each describe is a separate SFDX call, so run them side by side
+            with ThreadPoolExecutor(max_workers=MAX_DESCRIBE_WORKERS) as executor:
+                for obj_name, details in zip(unique_objects, executor.map(get_object_details, unique_objects)):
+                    if details:
+                        object_details[obj_name] = details
         
         # Format and output results
         if output_format == 'json':
@@ -321,7 +706,7 @@ def main():
                     "unique_objects": unique_objects
                 }
             
-            output = json.dumps(output_data, indent=2)
+            output = _dumps_json(output_data)
         
         elif output_format == 'csv':
             import csv
@@ -338,12 +723,10 @@ def main():
             
             # Write object data
             for obj_name in unique_objects:
-                # Determine which terms matched this object
-                matching_terms = [term for term, objects in results.items() if obj_name in objects]
-                matching_terms_str = ', '.join(matching_terms)
+                matching_terms_str = ', '.join(term_map[obj_name])
                 
-                if include_details and obj_name in object_details:
-                    details = object_details[obj_name]
+                details = object_details.get(obj_name)
+                if details:
                     writer.writerow([
                         obj_name,
                         'Yes' if obj_name.endswith('__c') else 'No',
@@ -361,25 +744,29 @@ def main():
             output = output_buffer.getvalue()
         
         else:  # text format
-            output = f"Found {len(unique_objects)} matching objects:\n\n"
+            import io
+            
+            # Write into a buffer, as repeated += would copy the output so far on every line
+            output_buffer = io.StringIO()
+            output_buffer.write(f"Found {len(unique_objects)} matching objects:\n\n")
             
             for obj_name in unique_objects:
-                # Determine which terms matched this object
-                matching_terms = [term for term, objects in results.items() if obj_name in objects]
-                matching_terms_str = ', '.join(matching_terms)
+                matching_terms_str = ', '.join(term_map[obj_name])
                 
-                output += f"{obj_name} (Matches: {matching_terms_str})\n"
+                output_buffer.write(f"{obj_name} (Matches: {matching_terms_str})\n")
                 
-                if include_details and obj_name in object_details:
-                    details = object_details[obj_name]
-                    output += f"  Label: {details.get('label', '')}\n"
-                    output += f"  Fields: {len(details.get('fields', []))}\n"
-                    output += f"  Custom: {'Yes' if obj_name.endswith('__c') else 'No'}\n"
-                    output += "\n"
+                details = object_details.get(obj_name)
+                if details:
+                    output_buffer.write(f"  Label: {details.get('label', '')}\n")
+                    output_buffer.write(f"  Fields: {len(details.get('fields', []))}\n")
+                    output_buffer.write(f"  Custom: {'Yes' if obj_name.endswith('__c') else 'No'}\n")
+                    output_buffer.write("\n")
+            
+            output = output_buffer.getvalue()
         
         # Output results
         if output_file:
-            with open(output_file, 'w') as f:
+            with open(output_file, 'w', encoding='utf-8') as f:
                 f.write(output)
             print(f"Results saved to {output_file}")
         else:
@@ -5,17 +5,118 @@ import json
 import argparse
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import difflib
+import re
+import hashlib
+import os
+import time
+import shutil
+import urllib.parse
+
+# Try to import rapidfuzz - we'll use its C++ scorers for fuzzy matching if available
+try:
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# Try to import python-Levenshtein - without rapidfuzz, its C ratio is a much faster fallback than difflib
+try:
+    from Levenshtein import ratio as levenshtein_ratio
+    HAS_LEVENSHTEIN = True
+except ImportError:
+    HAS_LEVENSHTEIN = False
+
+# Try to import orjson - we'll use it to parse and write large JSON payloads if available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # The minimum similarity score (0-1) required for a fuzzy match
 DEFAULT_SIMILARITY_THRESHOLD = 0.6
 
+# Boundary scores count as matches despite float error in threshold * 100
+SCORE_EPSILON = 1e-4
+
+# Cached SFDX results live here, one file per org and command
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".sfdcaudit_cache")
+
+# How long a cached SFDX result stays valid, in seconds
+CACHE_TTL_SECONDS = 3600
+
+# Set to False (--no-cache) to always query the org
+USE_CACHE = True
+
+# Shared HTTP session so REST calls reuse pooled keep-alive connections,
+# retrying transient connection failures and 5xx responses with backoff
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                                       max_retries=Retry(total=3, backoff_factor=0.3,
+                                                         status_forcelist=(500, 502, 503, 504))))
+
+# Tooling API queries for the package sources, sent together in one composite request
+INSTALLED_PACKAGES_QUERY = "SELECT Id, SubscriberPackage.Name, SubscriberPackage.NamespacePrefix FROM InstalledSubscriberPackage"
+NAMESPACE_REGISTRY_QUERY = "SELECT Id, NamespacePrefix FROM NamespaceRegistry"
+TOOLING_QUERIES = (INSTALLED_PACKAGES_QUERY, NAMESPACE_REGISTRY_QUERY)
+
+# Resolved CLI executable paths, keyed by name (only executables that were found)
+_executable_paths = {}
+
+# Whether check_sfdx_installed has already succeeded in this process
+_sfdx_checked = False
+
+# Connection details from the first successful org display (see get_tooling_api_connection)
+_connection = None
+
+# Results of org queries that succeeded in this process, keyed by query
+_query_results = {}
+
+def _loads_json(data):
+    """Parse a JSON str or bytes payload, using orjson if available
+    
+    orjson's decode errors subclass json.JSONDecodeError, so callers can catch
+    that either way.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps_json(data):
+    """Serialize data as JSON indented by two spaces, using orjson if available"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
+def _find_executable(name):
+    """Return the full path of a CLI executable, or the name if it isn't on PATH
+    
+    Commands run without a shell, so this is needed to find wrappers such as
+    sfdx.cmd on Windows. Paths that were found are remembered for the rest of
+    the process.
+    """
+    path = _executable_paths.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is None:
+            return name
+        _executable_paths[name] = path
+    return path
+
 def run_sfdx_command(command, capture_json=True):
-    """Run an SFDX command and return the result"""
+    """Run an SFDX command and return the result
+    
+    Args:
+        command: Command as an argument list, e.g. ["sfdx", "force:org:display", "--json"]
+        capture_json: If True, parse the output as JSON
+    """
     try:
         result = subprocess.run(
-            command,
-            shell=True,
+            [_find_executable(command[0])] + command[1:],
+            shell=False,
             check=False,  # Don't raise exception on non-zero return code
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -25,32 +126,36 @@ def run_sfdx_command(command, capture_json=True):
         )
         
         if result.returncode != 0:
-            print(f"Error executing command: {command}")
+            print(f"Error executing command: {' '.join(command)}")
             print(f"Error: {result.stderr}")
             return None
         
         if capture_json:
             try:
-                return json.loads(result.stdout)
+                return _loads_json(result.stdout)
             except json.JSONDecodeError as e:
-                print(f"Error parsing JSON from command: {command}")
+                print(f"Error parsing JSON from command: {' '.join(command)}")
                 print(f"Error details: {str(e)}")
                 print(f"Output (first 1000 chars): {result.stdout[:1000]}")
                 return None
         else:
             return result.stdout
     except Exception as e:
-        print(f"Error executing command: {command}")
+        print(f"Error executing command: {' '.join(command)}")
         print(f"Exception: {str(e)}")
         return None
 
 def check_sfdx_installed():
-    """Check if SFDX CLI is installed and authorized"""
+    """Check if SFDX CLI is installed and authorized (once per process)"""
+    global _sfdx_checked
+    if _sfdx_checked:
+        return True
+    
     try:
         # Check if SFDX is installed
         subprocess.run(
-            "sfdx --version",
-            shell=True,
+            [_find_executable("sfdx"), "--version"],
+            shell=False,
             check=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -58,14 +163,15 @@ def check_sfdx_installed():
         )
         
         # Check if there's an authorized org
-        result = run_sfdx_command("sfdx force:org:display --json")
+        result = run_sfdx_command(["sfdx", "force:org:display", "--json"])
         if not result or 'result' not in result:
             print("No authorized Salesforce org found.")
             print("Please authorize an org using: sfdx force:auth:web:login")
             sys.exit(1)
             
+        _sfdx_checked = True
         return True
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         print("SFDX CLI not found or not properly installed.")
         print("Please install SFDX CLI from: https://developer.salesforce.com/tools/sfdxcli")
         sys.exit(1)
@@ -74,10 +180,18 @@ def check_sfdx_installed():
         sys.exit(1)
 
 def get_tooling_api_connection():
-    """Get connection information for the Tooling API"""
+    """Get connection information for the Tooling API
+    
+    The org is only displayed until that succeeds; later calls return the
+    saved connection.
+    """
+    global _connection
+    if _connection is not None:
+        return _connection
+    
     try:
         # Get org authentication details
-        auth_result = run_sfdx_command("sfdx force:org:display --json")
+        auth_result = run_sfdx_command(["sfdx", "force:org:display", "--json"])
         if not auth_result or 'result' not in auth_result:
             print("Failed to get org authentication details")
             return None
@@ -90,75 +204,250 @@ def get_tooling_api_connection():
             print("Missing instanceUrl or accessToken in SFDX response")
             return None
             
-        return {
+        _connection = {
             "instance_url": instance_url,
             "access_token": access_token
         }
+        return _connection
     except Exception as e:
         print(f"Error getting Tooling API connection: {str(e)}")
         return None
 
-def fuzzy_match(search_term, text, threshold=DEFAULT_SIMILARITY_THRESHOLD):
-    """Check if the search term fuzzy matches the text"""
+def _sf_rest(path, params=None, body=None):
+    """Call a Salesforce REST API resource directly, without starting the CLI
+    
+    Args:
+        path: Resource path below /services/data/v57.0/, e.g. "sobjects/"
+        params: Optional query string parameters
+        body: Optional JSON body; when given the resource is POSTed to
+        
+    Returns:
+        Parsed JSON response, or None if the request failed
+    """
+    connection = get_tooling_api_connection()
+    if not connection:
+        return None
+    
+    _session.headers.update({
+        "Authorization": f"Bearer {connection['access_token']}",
+        "Content-Type": "application/json"
+    })
+    
+    try:
+        url = f"{connection['instance_url']}/services/data/v57.0/{path}"
+        if body is not None:
+            response = _session.post(url, params=params, json=body)
+        else:
+            response = _session.get(url, params=params)
+        if response.status_code == 200:
+            return _loads_json(response.content)
+        print(f"Error calling {path}: HTTP {response.status_code}")
+    except Exception as e:
+        print(f"Error calling {path}: {str(e)}")
+    
+    return None
+
+def _command_cache_path(command):
+    """Return the cache file for a command's result against the connected org
+    
+    Files are keyed by the org's instance URL, so results from different orgs
+    never mix. Returns None if there is no connection to key by.
+    """
+    connection = get_tooling_api_connection()
+    if not connection:
+        return None
+    org_hash = hashlib.sha1(connection["instance_url"].encode('utf-8')).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, org_hash + "_" + re.sub(r'[^A-Za-z0-9.@-]+', '_', command) + ".json")
+
+def _load_cached_result(command):
+    """Load a cached command result if it is younger than CACHE_TTL_SECONDS, else None"""
+    if not USE_CACHE:
+        return None
+    path = _command_cache_path(command)
+    if path is None:
+        return None
+    try:
+        if time.time() - os.path.getmtime(path) >= CACHE_TTL_SECONDS:
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_cached_result(command, result):
+    """Save a command result to the cache, warning instead of failing"""
+    path = _command_cache_path(command)
+    if path is None:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(result, f)
+    except OSError as e:
+        print(f"Could not write cache file for {command}: {str(e)}")
+
+def _run_cached_sfdx_command(command):
+    """Run an SFDX command, reusing a result cached by a recent run
+    
+    Only successful results are cached.
+    """
+    cache_key = " ".join(command)
+    result = _load_cached_result(cache_key)
+    if result is None:
+        result = run_sfdx_command(command)
+        if result:
+            _save_cached_result(cache_key, result)
+    return result
+
+def fuzzy_match(search_term, text, threshold=DEFAULT_SIMILARITY_THRESHOLD, term_lower=None, text_lower=None):
+    """Check if the search term fuzzy matches the text
+    
+    Callers comparing the same strings many times can pass their lowercased
+    forms as term_lower/text_lower so they are only computed once.
+    """
     # None check
     if text is None:
         return False
+    
+    if term_lower is None:
+        term_lower = search_term.lower()
+    if text_lower is None:
+        text_lower = text.lower()
         
     # Simple case: direct substring match
-    if search_term.lower() in text.lower():
+    if term_lower in text_lower:
         return True
     
-    # Advanced case: fuzzy matching using difflib
-    similarity = difflib.SequenceMatcher(None, search_term.lower(), text.lower()).ratio()
-    return similarity >= threshold
+    # Advanced case: fuzzy matching using rapidfuzz, which can stop early
+    # once the score can no longer reach the cutoff
+    if HAS_RAPIDFUZZ:
+        score_cutoff = max(threshold * 100 - SCORE_EPSILON, 0)
+        score = fuzz.ratio(term_lower, text_lower, score_cutoff=score_cutoff)
+        return score >= score_cutoff
+    
+    # Fallback: fuzzy matching using python-Levenshtein or difflib
+    return _similarity_ratio(term_lower, text_lower) >= threshold
+
+def _similarity_ratio(a, b):
+    """Similarity of two strings (0-1) for when rapidfuzz isn't available
+    
+    python-Levenshtein's ratio is the same indel-based score as fuzz.ratio,
+    computed in C; difflib's SequenceMatcher is the pure-Python last resort.
+    """
+    if HAS_LEVENSHTEIN:
+        return levenshtein_ratio(a, b)
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+def _cached_query(key, fetch):
+    """Return fetch()'s result, reusing the first successful one in this process
+    
+    fetch returns None on failure. Failures are not remembered, so the next
+    call tries again.
+    """
+    if key not in _query_results:
+        result = fetch()
+        if result is None:
+            return None
+        _query_results[key] = result
+    return _query_results[key]
+
+def _get_tooling_query_records():
+    """Run the package Tooling API queries in a single composite request
+    
+    Queries already answered in this process, or with a recent cached result,
+    are not sent again.
+    
+    Returns:
+        Dictionary mapping each query in TOOLING_QUERIES to its records;
+        queries that failed are left out
+    """
+    records = {}
+    pending = []
+    for query in TOOLING_QUERIES:
+        cached = _query_results.get(query)
+        if cached is None:
+            cached = _load_cached_result(query)
+            if cached is not None:
+                _query_results[query] = cached
+        if cached is None:
+            pending.append(query)
+        else:
+            records[query] = cached
+    
+    if not pending:
+        return records
+    
+    composite_request = [
+        {
+            "method": "GET",
+            "url": "/services/data/v57.0/tooling/query/?" + urllib.parse.urlencode({"q": query}),
+            "referenceId": f"query{i}"
+        }
+        for i, query in enumerate(pending)
+    ]
+    result = _sf_rest("tooling/composite", body={"compositeRequest": composite_request})
+    if not result:
+        return records
+    
+    responses = {response.get('referenceId'): response for response in result.get('compositeResponse', [])}
+    for i, query in enumerate(pending):
+        response = responses.get(f"query{i}", {})
+        if response.get('httpStatusCode') == 200 and isinstance(response.get('body'), dict):
+            records[query] = response['body'].get('records', [])
+            _query_results[query] = records[query]
+            _save_cached_result(query, records[query])
+        else:
+            print(f"Error running Tooling API query: {query}")
+    
+    return records
 
 def get_installed_packages():
-    """Get list of installed packages from Package Manager"""
-    cmd = "sfdx force:package:installed:list --json"
-    result = run_sfdx_command(cmd)
+    """Get list of installed packages from Package Manager
+    
+    The packages come from the InstalledSubscriberPackage Tooling API object;
+    the CLI is only used if that query fails.
+    """
+    return _cached_query("installed packages", _fetch_installed_packages) or []
+
+def _fetch_installed_packages():
+    """Fetch installed packages for get_installed_packages, or None on failure"""
+    records = _get_tooling_query_records().get(INSTALLED_PACKAGES_QUERY)
+    if records is not None:
+        packages = []
+        for record in records:
+            subscriber_package = record.get('SubscriberPackage') or {}
+            packages.append({
+                'Id': record.get('Id'),
+                'Package': subscriber_package.get('Name') or '',
+                'NamespacePrefix': subscriber_package.get('NamespacePrefix') or ''
+            })
+        return packages
+    
+    cmd = ["sfdx", "force:package:installed:list", "--json"]
+    result = _run_cached_sfdx_command(cmd)
     
     if not result or 'result' not in result:
-        return []
+        return None
     
     return result['result']
 
 def get_namespace_registry():
     """Get namespaces from NamespaceRegistry using Tooling API"""
-    connection = get_tooling_api_connection()
-    if not connection:
-        return []
-    
-    instance_url = connection["instance_url"]
-    access_token = connection["access_token"]
-    
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    }
-    
-    try:
-        url = f"{instance_url}/services/data/v57.0/tooling/query"
-        query = "SELECT Id, NamespacePrefix FROM NamespaceRegistry"
-        params = {"q": query}
-        
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            result = response.json()
-            return result.get('records', [])
-    except Exception as e:
-        print(f"Error querying NamespaceRegistry: {str(e)}")
-    
-    return []
+    return _get_tooling_query_records().get(NAMESPACE_REGISTRY_QUERY, [])
 
 def get_custom_fields_with_namespace():
     """Get custom fields that have namespace prefixes"""
+    return _cached_query("custom fields", _fetch_custom_fields_with_namespace) or []
+
+def _fetch_custom_fields_with_namespace():
+    """Fetch namespaced custom fields for get_custom_fields_with_namespace, or None on failure"""
     try:
         # Query for custom fields using Tooling API
-        cmd = "sfdx force:mdapi:listmetadata -m CustomField --json"
-        result = run_sfdx_command(cmd)
+        cmd = ["sfdx", "force:mdapi:listmetadata", "-m", "CustomField", "--json"]
+        result = _run_cached_sfdx_command(cmd)
         
         if not result or not isinstance(result.get('result'), list):
-            return []
+            return None
         
         # Filter for fields with namespace prefixes
         namespace_fields = []
@@ -177,17 +466,21 @@ def get_custom_fields_with_namespace():
         return namespace_fields
     except Exception as e:
         print(f"Error getting custom fields: {str(e)}")
-        return []
+        return None
 
 def get_custom_objects_with_namespace():
     """Get custom objects that have namespace prefixes"""
+    return _cached_query("custom objects", _fetch_custom_objects_with_namespace) or []
+
+def _fetch_custom_objects_with_namespace():
+    """Fetch namespaced custom objects for get_custom_objects_with_namespace, or None on failure"""
     try:
         # Query for custom objects using Tooling API
-        cmd = "sfdx force:mdapi:listmetadata -m CustomObject --json"
-        result = run_sfdx_command(cmd)
+        cmd = ["sfdx", "force:mdapi:listmetadata", "-m", "CustomObject", "--json"]
+        result = _run_cached_sfdx_command(cmd)
         
         if not result or not isinstance(result.get('result'), list):
-            return []
+            return None
         
         # Filter for objects with namespace prefixes
         namespace_objects = []
@@ -206,7 +499,80 @@ def get_custom_objects_with_namespace():
         return namespace_objects
     except Exception as e:
         print(f"Error getting custom objects: {str(e)}")
-        return []
+        return None
+
+def _iter_package_sources():
+    """Yield the package and namespace names to match against, one list per source
+    
+    Sources are ordered cheapest first, and each is only fetched when the
+    iteration reaches it: installed packages and NamespaceRegistry (one
+    composite request), then custom objects, then custom fields, which are
+    usually the largest metadata listing.
+    
+    Each name is only yielded once: a package's namespace is typically shared
+    by many of its fields and objects, and scoring it again can't change the
+    result.
+    """
+    seen = set()
+    
+    def new_names(names):
+        unique = [name for name in dict.fromkeys(names) if name not in seen]
+        seen.update(unique)
+        return unique
+    
+    # Installed package names and namespaces
+    names = []
+    for pkg in get_installed_packages():
+        if not isinstance(pkg, dict):
+            continue
+        names.append(pkg.get('Package', pkg.get('PackageName', '')))
+        names.append(pkg.get('NamespacePrefix', ''))
+    yield new_names(names)
+    
+    # NamespaceRegistry
+    yield new_names(record.get('NamespacePrefix', '') for record in get_namespace_registry())
+    
+    # Custom objects
+    yield new_names(obj['namespace'] for obj in get_custom_objects_with_namespace())
+    
+    # Custom fields
+    yield new_names(field['namespace'] for field in get_custom_fields_with_namespace())
+
+def _match_terms_to_candidates(search_terms, candidates, threshold=DEFAULT_SIMILARITY_THRESHOLD):
+    """Check which search terms fuzzy match any of the candidate names
+    
+    Uses the same rules as fuzzy_match. With rapidfuzz, all terms are scored
+    against all candidates in a single process.cdist call (C++, multi-threaded).
+    
+    Args:
+        search_terms: List of terms to search for
+        candidates: List of package or namespace names (None entries are ignored)
+        threshold: Minimum similarity score for fuzzy matching (0-1)
+        
+    Returns:
+        List of booleans, one per search term
+    """
+    terms_lower = [term.lower() for term in search_terms]
+    candidates_lower = [candidate.lower() for candidate in candidates if candidate is not None]
+    if not candidates_lower:
+        return [False] * len(search_terms)
+    
+    if not HAS_RAPIDFUZZ:
+        return [
+            any(fuzzy_match(term, candidate, threshold, term_lower, candidate) for candidate in candidates_lower)
+            for term, term_lower in zip(search_terms, terms_lower)
+        ]
+    
+    score_cutoff = max(threshold * 100 - SCORE_EPSILON, 0)
+    scores = process.cdist(terms_lower, candidates_lower, scorer=fuzz.ratio,
+                           score_cutoff=score_cutoff, workers=-1)
+    found = (scores >= score_cutoff).any(axis=1).tolist()
+    
+    # Substring matches always count, whatever their ratio
+    for i, term_lower in enumerate(terms_lower):
+        if not found[i]:
+            found[i] = any(term_lower in candidate for candidate in candidates_lower)
+    return found
 
 def search_packages_with_term(search_term, threshold=DEFAULT_SIMILARITY_THRESHOLD):
     """Search for packages and namespaces matching a search term
@@ -218,44 +584,16 @@ def search_packages_with_term(search_term, threshold=DEFAULT_SIMILARITY_THRESHOL
     Returns:
         Boolean indicating if the package/namespace was found
     """
-    # Check installed packages
-    installed_packages = get_installed_packages()
-    for pkg in installed_packages:
-        if not isinstance(pkg, dict):
-            continue
-            
-        # Check package name and namespace
-        pkg_name = pkg.get('Package', pkg.get('PackageName', ''))
-        namespace = pkg.get('NamespacePrefix', '')
-        
-        if (fuzzy_match(search_term, pkg_name, threshold) or 
-            fuzzy_match(search_term, namespace, threshold)):
-            return True
-    
-    # Check NamespaceRegistry
-    namespace_records = get_namespace_registry()
-    for record in namespace_records:
-        namespace = record.get('NamespacePrefix', '')
-        if fuzzy_match(search_term, namespace, threshold):
-            return True
-    
-    # Check custom fields
-    namespace_fields = get_custom_fields_with_namespace()
-    for field in namespace_fields:
-        if fuzzy_match(search_term, field['namespace'], threshold):
-            return True
-    
-    # Check custom objects
-    namespace_objects = get_custom_objects_with_namespace()
-    for obj in namespace_objects:
-        if fuzzy_match(search_term, obj['namespace'], threshold):
-            return True
-    
-    return False
+    # any() stops at the first matching source, so later sources are never fetched
+    return any(_match_terms_to_candidates([search_term], names, threshold)[0] for names in _iter_package_sources())
 
 def search_packages_multi_terms(search_terms, threshold=DEFAULT_SIMILARITY_THRESHOLD):
     """Search for packages and namespaces matching multiple search terms
     
+    Each source is scored against all terms not found in an earlier source
+    at once, and sources after the point where every term is found are
+    never fetched.
+    
     Args:
         search_terms: List of terms to search for
         threshold: Minimum similarity score for fuzzy matching
@@ -263,11 +601,22 @@ def search_packages_multi_terms(search_terms, threshold=DEFAULT_SIMILARITY_THRES
     Returns:
         Dictionary mapping terms to boolean existence status
     """
-    results = {}
+    results = {term: False for term in search_terms}
+    
+    # Fetch the Tooling API sources once, in one round-trip, for all terms
+    _get_tooling_query_records()
     
-    for term in search_terms:
-        exists = search_packages_with_term(term, threshold)
-        results[term] = exists
+    pending = list(results)
+    for names in _iter_package_sources():
+        if not pending:
+            break
+        found = _match_terms_to_candidates(pending, names, threshold)
+        for term, exists in zip(pending, found):
+            if exists:
+                results[term] = True
+        pending = [term for term, exists in zip(pending, found) if not exists]
+    
+    for term, exists in results.items():
         print(f"Package '{term}': {'Found' if exists else 'Not found'}")
     
     return results
@@ -282,6 +631,8 @@ def parse_args():
                         help='Output format (default: text)')
     parser.add_argument('--output-file', '-f', type=str, 
                         help='File to save results to (default: output to console)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Ignore SFDX results cached in the last {CACHE_TTL_SECONDS // 60} minutes')
     return parser.parse_args()
 
 def main():
@@ -290,6 +641,9 @@ def main():
         # Parse command-line arguments
         args = parse_args()
         
+        global USE_CACHE
+        USE_CACHE = not args.no_cache
+        
         search_term = args.search_term
         threshold = args.threshold
         output_format = args.output
@@ -309,7 +663,7 @@ def main():
         
         # Format and output results
         if output_format == 'json':
-            output = json.dumps(results, indent=2)
+            output = _dumps_json(results)
         elif output_format == 'csv':
             import csv
             import io
@@ -331,7 +685,7 @@ def main():
         
         # Output results
         if output_file:
-            with open(output_file, 'w') as f:
+            with open(output_file, 'w', encoding='utf-8') as f:
                 f.write(output)
             print(f"\nResults saved to {output_file}")
         else:
@@ -6,16 +6,95 @@ import argparse
 import sys
 import requests
 import difflib
+import shutil
+import hashlib
+import os
+import time
+
+# Try to import rapidfuzz - we'll use its C++ scorers for fuzzy matching if available
+try:
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# Try to import orjson - we'll use it to parse and write large JSON payloads if available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # The minimum similarity score (0-1) required for a fuzzy match
 DEFAULT_SIMILARITY_THRESHOLD = 0.6
 
+# cdist scores are float32 and threshold * 100 can overshoot (0.55 * 100 is
+# 55.00000000000001), so cutoffs are lowered by this much
+SCORE_EPSILON = 1e-4
+
+# Cached report and dashboard records live here, one file per org and type
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".sfdcaudit_cache")
+
+# How long cached records stay valid, in seconds (--cache-ttl)
+CACHE_TTL_SECONDS = 3600
+
+# Set to False (--no-cache) to always query the org
+USE_CACHE = True
+
+# Resolved CLI executable paths, keyed by name (only executables that were found)
+_executable_paths = {}
+
+# Whether check_sfdx_installed has already succeeded in this process
+_sfdx_checked = False
+
+# Connection details from the first successful org display (see get_tooling_api_connection)
+_connection = None
+
+# Records from queries that succeeded in this process, keyed by (label, search terms)
+_fetched_records = {}
+
+def _loads_json(data):
+    """Parse a JSON str or bytes payload, using orjson if available
+    
+    orjson's decode errors subclass json.JSONDecodeError, so callers can catch
+    that either way.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps_json(data):
+    """Serialize data as JSON indented by two spaces, using orjson if available"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
+def _find_executable(name):
+    """Return the full path of a CLI executable, or the name if it isn't on PATH
+    
+    Commands run without a shell, so this is needed to find wrappers such as
+    sfdx.cmd on Windows. Paths that were found are remembered for the rest of
+    the process.
+    """
+    path = _executable_paths.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is None:
+            return name
+        _executable_paths[name] = path
+    return path
+
 def run_sfdx_command(command, capture_json=True):
-    """Run an SFDX command and return the result"""
+    """Run an SFDX command and return the result
+    
+    Args:
+        command: Command as an argument list, e.g. ["sfdx", "force:org:display", "--json"]
+        capture_json: If True, parse the output as JSON
+    """
     try:
         result = subprocess.run(
-            command,
-            shell=True,
+            [_find_executable(command[0])] + command[1:],
+            shell=False,
             check=False,  # Don't raise exception on non-zero return code
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -25,32 +104,36 @@ def run_sfdx_command(command, capture_json=True):
         )
         
         if result.returncode != 0:
-            print(f"Error executing command: {command}")
+            print(f"Error executing command: {' '.join(command)}")
             print(f"Error: {result.stderr}")
             return None
         
         if capture_json:
             try:
-                return json.loads(result.stdout)
+                return _loads_json(result.stdout)
             except json.JSONDecodeError as e:
-                print(f"Error parsing JSON from command: {command}")
+                print(f"Error parsing JSON from command: {' '.join(command)}")
                 print(f"Error details: {str(e)}")
                 print(f"Output (first 1000 chars): {result.stdout[:1000]}")
                 return None
         else:
             return result.stdout
     except Exception as e:
-        print(f"Error executing command: {command}")
+        print(f"Error executing command: {' '.join(command)}")
         print(f"Exception: {str(e)}")
         return None
 
 def check_sfdx_installed():
-    """Check if SFDX CLI is installed and authorized"""
+    """Check if SFDX CLI is installed and authorized (once per process)"""
+    global _sfdx_checked
+    if _sfdx_checked:
+        return True
+    
     try:
         # Check if SFDX is installed
         subprocess.run(
-            "sfdx --version",
-            shell=True,
+            [_find_executable("sfdx"), "--version"],
+            shell=False,
             check=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -58,14 +141,15 @@ def check_sfdx_installed():
         )
         
         # Check if there's an authorized org
-        result = run_sfdx_command("sfdx force:org:display --json")
+        result = run_sfdx_command(["sfdx", "force:org:display", "--json"])
         if not result or 'result' not in result:
             print("No authorized Salesforce org found.")
             print("Please authorize an org using: sfdx force:auth:web:login")
             sys.exit(1)
             
+        _sfdx_checked = True
         return True
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         print("SFDX CLI not found or not properly installed.")
         print("Please install SFDX CLI from: https://developer.salesforce.com/tools/sfdxcli")
         sys.exit(1)
@@ -74,10 +158,18 @@ def check_sfdx_installed():
         sys.exit(1)
 
 def get_tooling_api_connection():
-    """Get connection information for the Tooling API"""
+    """Get connection information for the Tooling API
+    
+    The org is only displayed until that succeeds; later calls return the
+    saved connection.
+    """
+    global _connection
+    if _connection is not None:
+        return _connection
+    
     try:
         # Get org authentication details
-        auth_result = run_sfdx_command("sfdx force:org:display --json")
+        auth_result = run_sfdx_command(["sfdx", "force:org:display", "--json"])
         if not auth_result or 'result' not in auth_result:
             print("Failed to get org authentication details")
             return None
@@ -90,74 +182,311 @@ def get_tooling_api_connection():
             print("Missing instanceUrl or accessToken in SFDX response")
             return None
             
-        return {
+        _connection = {
             "instance_url": instance_url,
             "access_token": access_token
         }
+        return _connection
     except Exception as e:
         print(f"Error getting Tooling API connection: {str(e)}")
         return None
 
 def fuzzy_match(search_term, text, threshold=DEFAULT_SIMILARITY_THRESHOLD):
     """Check if the search term fuzzy matches the text"""
-    # None check
-    if text is None:
-        return False
+    return _match_terms_to_texts([search_term], [text], threshold)[0][0]
+
+def _match_terms_to_texts(search_terms, texts, threshold=DEFAULT_SIMILARITY_THRESHOLD):
+    """Check which of the texts each search term fuzzy matches
+    
+    A term matches a text it is a substring of (ignoring case), or whose
+    similarity ratio reaches the threshold. With rapidfuzz, all terms are scored
+    against all texts in a single process.cdist call (C++, multi-threaded)
+    instead of one Python-level comparison per pair.
+    
+    Args:
+        search_terms: List of terms to search for
+        texts: List of field values to search in (None values never match)
+        threshold: Minimum similarity score for fuzzy matching (0-1)
         
-    # Simple case: direct substring match
-    if search_term.lower() in text.lower():
-        return True
+    Returns:
+        List with, for each search term, a list of booleans, one per text
+    """
+    if not HAS_RAPIDFUZZ:
+        return _match_terms_with_difflib(search_terms, texts, threshold)
+    
+    terms_lower = [term.lower() for term in search_terms]
+    texts_lower = [text.lower() if text is not None else "" for text in texts]
+    score_cutoff = max(threshold * 100 - SCORE_EPSILON, 0)
+    scores = process.cdist(terms_lower, texts_lower, scorer=fuzz.ratio,
+                           score_cutoff=score_cutoff, workers=-1)
     
-    # Advanced case: fuzzy matching using difflib
-    similarity = difflib.SequenceMatcher(None, search_term.lower(), text.lower()).ratio()
-    return similarity >= threshold
+    return [
+        [
+            text is not None and (term_lower in text_lower or score >= score_cutoff)
+            for text, text_lower, score in zip(texts, texts_lower, term_scores)
+        ]
+        for term_lower, term_scores in zip(terms_lower, scores.tolist())
+    ]
 
-def search_reports_with_term(search_term, threshold=DEFAULT_SIMILARITY_THRESHOLD):
-    """Search for reports containing a search term
+def _match_terms_with_difflib(search_terms, texts, threshold):
+    """difflib fallback for _match_terms_to_texts
+    
+    Each text is lowercased once and kept as seq2 of one SequenceMatcher, so
+    its b2j index is built once and reused for every term via set_seq1. Pairs
+    are rejected on the upper bounds real_quick_ratio (lengths) and
+    quick_ratio (shared characters) before the full ratio is computed.
+    """
+    terms_lower = [term.lower() for term in search_terms]
+    
+    text_columns = []
+    for text in texts:
+        if text is None:
+            text_columns.append([False] * len(terms_lower))
+            continue
+        
+        text_lower = text.lower()
+        matcher = difflib.SequenceMatcher(None, b=text_lower)
+        column = []
+        for term_lower in terms_lower:
+            if term_lower in text_lower:
+                column.append(True)
+            else:
+                matcher.set_seq1(term_lower)
+                column.append(
+                    matcher.real_quick_ratio() >= threshold
+                    and matcher.quick_ratio() >= threshold
+                    and matcher.ratio() >= threshold
+                )
+        text_columns.append(column)
+    
+    # Transpose to one row of booleans per term
+    return [[column[i] for column in text_columns] for i in range(len(terms_lower))]
+
+def _query_soql(auth, query):
+    """Execute a SOQL query against the REST API with pagination handling
     
     Args:
-        search_term: The text to search for in report names/descriptions
-        threshold: Minimum similarity score for fuzzy matching (0-1)
+        auth: Connection dictionary with instance_url and access_token
+        query: SOQL query to run
         
     Returns:
-        List of matching report dictionaries with Name, Id, and Description
+        List of records, or None if the query failed
     """
-    # Check if SFDX is installed
-    check_sfdx_installed()
+    headers = {
+        "Authorization": f"Bearer {auth['access_token']}",
+        "Content-Type": "application/json"
+    }
+    
+    url = f"{auth['instance_url']}/services/data/v58.0/query"
+    
+    all_records = []
     
     try:
-        # Query reports using SOQL
-        query = f"SELECT Id, Name, Description, FolderName FROM Report"
-        cmd = f'sfdx force:data:soql:query -q "{query}" --json'
+        response = requests.get(url, headers=headers, params={"q": query})
         
-        result = run_sfdx_command(cmd)
-        if not result or 'result' not in result:
-            print("Failed to query reports")
+        while True:
+            if response.status_code != 200:
+                print(f"Error running query: {query}")
+                print(f"Error response: {response.text}")
+                return None
+            
+            result = _loads_json(response.content)
+            all_records.extend(result.get("records", []))
+            
+            # Handle pagination if needed
+            next_records_url = result.get("nextRecordsUrl")
+            if not next_records_url:
+                return all_records
+            response = requests.get(f"{auth['instance_url']}{next_records_url}", headers=headers)
+    
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        print(f"API request failed: {e}")
+        return None
+
+def _records_cache_path(connection, label):
+    """Return the cache file for an org's records, keyed by its instance URL"""
+    org_hash = hashlib.sha1(connection["instance_url"].encode('utf-8')).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{org_hash}_{label}.json")
+
+def _load_cached_records(connection, label):
+    """Load cached records if they are younger than CACHE_TTL_SECONDS, else None"""
+    if not USE_CACHE:
+        return None
+    path = _records_cache_path(connection, label)
+    try:
+        if time.time() - os.path.getmtime(path) >= CACHE_TTL_SECONDS:
+            return None
+        with open(path, 'rb') as f:
+            return _loads_json(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _save_cached_records(connection, label, records):
+    """Save records to the cache, warning instead of failing"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_records_cache_path(connection, label), 'w', encoding='utf-8') as f:
+            f.write(_dumps_json(records))
+    except OSError as e:
+        print(f"Could not write cache file for {label}: {str(e)}")
+
+def _escape_soql_like(term):
+    """Escape a term for use inside a quoted SOQL LIKE pattern"""
+    for char in ('\\', "'", '%', '_'):
+        term = term.replace(char, '\\' + char)
+    return term
+
+def _build_like_filter(fields, search_terms):
+    """Build a WHERE clause matching records where any field contains any term
+    
+    SOQL LIKE is case-insensitive, so this selects the same records as the
+    substring check in _match_terms_to_texts.
+    """
+    patterns = [f"'%{_escape_soql_like(term)}%'" for term in dict.fromkeys(search_terms)]
+    return " OR ".join(f"{field} LIKE {pattern}" for pattern in patterns for field in fields)
+
+def _server_filter_terms(search_terms, threshold):
+    """Return the terms to filter on in SOQL, or None if all records are needed
+    
+    At a threshold of 1.0 or more only substring hits can match, which SOQL
+    LIKE finds on the server. Lower thresholds need every record for fuzzy
+    scoring.
+    """
+    if threshold >= 1.0:
+        return tuple(search_terms)
+    return None
+
+def _fetch_reports(search_terms=None):
+    """Query reports once per process
+    
+    Args:
+        search_terms: Optional tuple of terms; if given, only reports whose
+            name, description or folder contains one of them are queried
+    
+    Returns:
+        List of report records, or an empty list if the query failed
+    """
+    return _query_records_once("SELECT Id, Name, Description, FolderName FROM Report", "reports",
+                          ('Name', 'Description', 'FolderName'), search_terms)
+
+def _fetch_dashboards(search_terms=None):
+    """Query dashboards once per process
+    
+    Args:
+        search_terms: Optional tuple of terms; if given, only dashboards whose
+            title, description or folder contains one of them are queried
+    
+    Returns:
+        List of dashboard records, or an empty list if the query failed
+    """
+    return _query_records_once("SELECT Id, Title, Description, FolderName FROM Dashboard", "dashboards",
+                          ('Title', 'Description', 'FolderName'), search_terms)
+
+def _query_records_once(query, label, filter_fields, search_terms=None):
+    """Return _query_records' result, reusing the first successful one in this process
+    
+    Failed queries are not remembered, so the next call tries again.
+    """
+    key = (label, search_terms)
+    if key not in _fetched_records:
+        records = _query_records(query, label, filter_fields, search_terms)
+        if records is None:
             return []
+        _fetched_records[key] = records
+    return _fetched_records[key]
+
+def _query_records(query, label, filter_fields, search_terms=None):
+    """Run a SOQL query over the REST API and return its records
+    
+    All records of a type are cached on disk per org. A fresh cache is used
+    even when search_terms are given, since matching runs locally anyway.
+    Otherwise, if search_terms are given, the query is first narrowed with a
+    LIKE filter on filter_fields; if the org rejects that filter, all records
+    are queried.
+    
+    Returns:
+        List of records, or None if the query failed
+    """
+    connection = get_tooling_api_connection()
+    if not connection:
+        # Explain what is missing (SFDX CLI or an authorized org) and exit
+        check_sfdx_installed()
+        return None
+    
+    try:
+        records = _load_cached_records(connection, label)
+        if records is not None:
+            print(f"Found {len(records)} total {label} (cached)")
+            return records
         
-        reports = result['result'].get('records', [])
-        print(f"Found {len(reports)} total reports")
+        if search_terms:
+            records = _query_soql(connection, f"{query} WHERE {_build_like_filter(filter_fields, search_terms)}")
+            if records is not None:
+                print(f"Found {len(records)} {label} containing the search terms")
+                return records
+            print(f"Falling back to querying all {label}")
         
-        # Filter reports using fuzzy matching
-        matching_reports = []
-        for report in reports:
-            name_match = fuzzy_match(search_term, report.get('Name', ''), threshold)
-            desc_match = fuzzy_match(search_term, report.get('Description', ''), threshold)
-            folder_match = fuzzy_match(search_term, report.get('FolderName', ''), threshold)
-            
-            if name_match or desc_match or folder_match:
-                matching_reports.append({
-                    'Name': report.get('Name', ''),
-                    'Id': report.get('Id', ''),
-                    'Description': report.get('Description', ''),
-                    'FolderName': report.get('FolderName', '')
-                })
+        records = _query_soql(connection, query)
+        if records is None:
+            print(f"Failed to query {label}")
+            return None
         
-        return matching_reports
+        print(f"Found {len(records)} total {label}")
+        _save_cached_records(connection, label, records)
+        return records
         
     except Exception as e:
-        print(f"Error searching reports: {str(e)}")
-        return []
+        print(f"Error searching {label}: {str(e)}")
+        return None
+
+def _filter_by_terms(records, title_field, search_terms, threshold=DEFAULT_SIMILARITY_THRESHOLD):
+    """Find the records matching each search term
+    
+    A record matches when the term fuzzy matches its title, description or
+    folder. Each field is scored for all terms in one batch.
+    
+    Args:
+        records: Report or dashboard records
+        title_field: 'Name' for reports, 'Title' for dashboards
+        search_terms: List of terms to search for
+        threshold: Minimum similarity score for fuzzy matching (0-1)
+        
+    Returns:
+        List with, for each search term, a list of matching record dictionaries
+        with the title field, Id, Description and FolderName
+    """
+    field_matches = [
+        _match_terms_to_texts(search_terms, [record.get(field, '') for record in records], threshold)
+        for field in (title_field, 'Description', 'FolderName')
+    ]
+    
+    matches = []
+    for title_matches, desc_matches, folder_matches in zip(*field_matches):
+        matches.append([
+            {
+                title_field: record.get(title_field, ''),
+                'Id': record.get('Id', ''),
+                'Description': record.get('Description', ''),
+                'FolderName': record.get('FolderName', '')
+            }
+            for record, title_match, desc_match, folder_match
+            in zip(records, title_matches, desc_matches, folder_matches)
+            if title_match or desc_match or folder_match
+        ])
+    return matches
+
+def search_reports_with_term(search_term, threshold=DEFAULT_SIMILARITY_THRESHOLD):
+    """Search for reports containing a search term
+    
+    Args:
+        search_term: The text to search for in report names/descriptions
+        threshold: Minimum similarity score for fuzzy matching (0-1)
+        
+    Returns:
+        List of matching report dictionaries with Name, Id, and Description
+    """
+    return _filter_by_terms(_fetch_reports(_server_filter_terms([search_term], threshold)),
+                           'Name', [search_term], threshold)[0]
 
 def search_dashboards_with_term(search_term, threshold=DEFAULT_SIMILARITY_THRESHOLD):
     """Search for dashboards containing a search term
@@ -169,46 +498,16 @@ def search_dashboards_with_term(search_term, threshold=DEFAULT_SIMILARITY_THRESH
     Returns:
         List of matching dashboard dictionaries with Title, Id, and Description
     """
-    # Check if SFDX is installed
-    check_sfdx_installed()
-    
-    try:
-        # Query dashboards using SOQL
-        query = f"SELECT Id, Title, Description, FolderName FROM Dashboard"
-        cmd = f'sfdx force:data:soql:query -q "{query}" --json'
-        
-        result = run_sfdx_command(cmd)
-        if not result or 'result' not in result:
-            print("Failed to query dashboards")
-            return []
-        
-        dashboards = result['result'].get('records', [])
-        print(f"Found {len(dashboards)} total dashboards")
-        
-        # Filter dashboards using fuzzy matching
-        matching_dashboards = []
-        for dashboard in dashboards:
-            title_match = fuzzy_match(search_term, dashboard.get('Title', ''), threshold)
-            desc_match = fuzzy_match(search_term, dashboard.get('Description', ''), threshold)
-            folder_match = fuzzy_match(search_term, dashboard.get('FolderName', ''), threshold)
-            
-            if title_match or desc_match or folder_match:
-                matching_dashboards.append({
-                    'Title': dashboard.get('Title', ''),
-                    'Id': dashboard.get('Id', ''),
-                    'Description': dashboard.get('Description', ''),
-                    'FolderName': dashboard.get('FolderName', '')
-                })
-        
-        return matching_dashboards
-        
-    except Exception as e:
-        print(f"Error searching dashboards: {str(e)}")
-        return []
+    return _filter_by_terms(_fetch_dashboards(_server_filter_terms([search_term], threshold)),
+                           'Title', [search_term], threshold)[0]
 
 def search_reports_and_dashboards_multi_terms(search_terms, threshold=DEFAULT_SIMILARITY_THRESHOLD):
     """Search for reports and dashboards containing multiple search terms
     
+    Reports and dashboards are each queried once, and all terms are matched
+    against the same records. With a threshold of 1.0 the query itself is
+    filtered to records containing one of the terms.
+    
     Args:
         search_terms: List of terms to search for
         threshold: Minimum similarity score for fuzzy matching (0-1)
@@ -218,11 +517,11 @@ def search_reports_and_dashboards_multi_terms(search_terms, threshold=DEFAULT_SI
     """
     results = {}
     
-    for term in search_terms:
-        # Search reports and dashboards for this term
-        matching_reports = search_reports_with_term(term, threshold)
-        matching_dashboards = search_dashboards_with_term(term, threshold)
-        
+    filter_terms = _server_filter_terms(search_terms, threshold)
+    report_matches = _filter_by_terms(_fetch_reports(filter_terms), 'Name', search_terms, threshold)
+    dashboard_matches = _filter_by_terms(_fetch_dashboards(filter_terms), 'Title', search_terms, threshold)
+    
+    for term, matching_reports, matching_dashboards in zip(search_terms, report_matches, dashboard_matches):
         results[term] = {
             'reports': matching_reports,
             'dashboards': matching_dashboards
@@ -263,6 +562,10 @@ def parse_args():
                         help='Output format (default: text)')
     parser.add_argument('--output-file', '-f', type=str, 
                         help='File to save results to (default: output to console)')
+    parser.add_argument('--cache-ttl', type=int, default=CACHE_TTL_SECONDS,
+                        help=f'Seconds to reuse cached reports and dashboards (default: {CACHE_TTL_SECONDS})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always query reports and dashboards from the org')
     return parser.parse_args()
 
 def main():
@@ -271,6 +574,10 @@ def main():
         # Parse command-line arguments
         args = parse_args()
         
+        global USE_CACHE, CACHE_TTL_SECONDS
+        USE_CACHE = not args.no_cache
+        CACHE_TTL_SECONDS = args.cache_ttl
+        
         search_term = args.search_term
         threshold = args.threshold
         output_format = args.output
@@ -290,7 +597,7 @@ def main():
         
         # Format and output results
         if output_format == 'json':
-            output = json.dumps(results, indent=2)
+            output = _dumps_json(results)
         elif output_format == 'csv':
             import csv
             import io
@@ -298,58 +605,56 @@ def main():
             output_buffer = io.StringIO()
             writer = csv.writer(output_buffer)
             
-            # Write reports
-            writer.writerow(['Type', 'Term', 'Name/Title', 'Id', 'Description', 'Folder'])
-            
+            # Build every row first, then serialize them in one writerows call
+            rows = [['Type', 'Term', 'Name/Title', 'Id', 'Description', 'Folder']]
             for term, term_results in results.items():
-                # Write reports
-                for report in term_results['reports']:
-                    writer.writerow([
-                        'Report',
-                        term,
-                        report.get('Name', ''),
-                        report.get('Id', ''),
-                        report.get('Description', ''),
-                        report.get('FolderName', '')
-                    ])
-                
-                # Write dashboards
-                for dashboard in term_results['dashboards']:
-                    writer.writerow([
-                        'Dashboard',
-                        term,
-                        dashboard.get('Title', ''),
-                        dashboard.get('Id', ''),
-                        dashboard.get('Description', ''),
-                        dashboard.get('FolderName', '')
-                    ])
+                rows.extend(
+                    ['Report', term, report.get('Name', ''), report.get('Id', ''),
+                     report.get('Description', ''), report.get('FolderName', '')]
+                    for report in term_results['reports']
+                )
+                rows.extend(
+                    ['Dashboard', term, dashboard.get('Title', ''), dashboard.get('Id', ''),
+                     dashboard.get('Description', ''), dashboard.get('FolderName', '')]
+                    for dashboard in term_results['dashboards']
+                )
+            writer.writerows(rows)
             
             output = output_buffer.getvalue()
         else:  # text format
-            output = ""
+            import io
+            
+            output_buffer = io.StringIO()
+            write = output_buffer.write
             for term, term_results in results.items():
-                output += f"\nResults for term '{term}':\n"
-                output += "-" * 80 + "\n"
+                reports = term_results['reports']
+                dashboards = term_results['dashboards']
+                write(f"\nResults for term '{term}':\n")
+                write("-" * 80 + "\n")
                 
                 # Reports
-                output += f"\nMatching Reports ({len(term_results['reports'])}):\n"
-                output += "-" * 40 + "\n"
-                for report in term_results['reports']:
-                    output += f"Name: {report.get('Name', '')}\n"
-                    output += f"Folder: {report.get('FolderName', '')}\n"
-                    if report.get('Description'):
-                        output += f"Description: {report.get('Description')}\n"
-                    output += f"Id: {report.get('Id', '')}\n\n"
+                write(f"\nMatching Reports ({len(reports)}):\n")
+                write("-" * 40 + "\n")
+                for report in reports:
+                    description = report.get('Description')
+                    write(f"Name: {report.get('Name', '')}\n")
+                    write(f"Folder: {report.get('FolderName', '')}\n")
+                    if description:
+                        write(f"Description: {description}\n")
+                    write(f"Id: {report.get('Id', '')}\n\n")
                 
                 # Dashboards
-                output += f"\nMatching Dashboards ({len(term_results['dashboards'])}):\n"
-                output += "-" * 40 + "\n"
-                for dashboard in term_results['dashboards']:
-                    output += f"Title: {dashboard.get('Title', '')}\n"
-                    output += f"Folder: {dashboard.get('FolderName', '')}\n"
-                    if dashboard.get('Description'):
-                        output += f"Description: {dashboard.get('Description')}\n"
-                    output += f"Id: {dashboard.get('Id', '')}\n\n"
+                write(f"\nMatching Dashboards ({len(dashboards)}):\n")
+                write("-" * 40 + "\n")
+                for dashboard in dashboards:
+                    description = dashboard.get('Description')
+                    write(f"Title: {dashboard.get('Title', '')}\n")
+                    write(f"Folder: {dashboard.get('FolderName', '')}\n")
+                    if description:
+                        write(f"Description: {description}\n")
+                    write(f"Id: {dashboard.get('Id', '')}\n\n")
+            
+            output = output_buffer.getvalue()
         
         # Output results
         if output_file:
@@ -1,27 +1,76 @@
 #!/usr/bin/env python3
 
+import asyncio
 import json
 import os
+import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Try to import httpx - we'll use it for async flow metadata fan-out if available
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+# Try to import h2 - httpx needs it to multiplex requests over HTTP/2
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+# Try to import orjson - we'll use it to parse and write large JSON payloads if available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Flow metadata GETs are independent round-trips, so overlap them over one
+# keep-alive session; the Tooling API tolerates this level of concurrency
+MAX_METADATA_WORKERS = 16
+
+# Query locators end in "-<offset>" (e.g. /query/01gD0000002HU6KIAW-2000), so
+# the URLs of all remaining pages can be derived from the first one
+NEXT_RECORDS_URL_PATTERN = re.compile(r'^(.*-)(\d+)$')
+
+def loads_json(data):
+    """Parse a JSON str or bytes payload, using orjson if available
+    
+    orjson's decode errors subclass json.JSONDecodeError, so callers can catch
+    that either way.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps_json(data):
+    """Serialize data as JSON indented by two spaces, using orjson if available"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
 
 def get_sfdx_auth() -> Dict[str, str]:
     """Get authentication details from SFDX CLI"""
     try:
         # Run SFDX command to get org info
         result = subprocess.run(
-            ["sfdx", "force:org:display", "--json"],
+            [shutil.which("sfdx") or "sfdx", "force:org:display", "--json"],
             capture_output=True,
             text=True,
-            check=True,
-            shell=True
+            check=True
         )
         
         # Parse JSON output
-        org_data = json.loads(result.stdout)
+        org_data = loads_json(result.stdout)
         
         if org_data.get("status") == 0:
             instance_url = org_data["result"].get("instanceUrl")
@@ -37,7 +86,7 @@ def get_sfdx_auth() -> Dict[str, str]:
         else:
             raise ValueError(f"SFDX command failed: {org_data.get('message')}")
     
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
         print(f"Error executing SFDX command: {e}")
         sys.exit(1)
     except json.JSONDecodeError as e:
@@ -47,12 +96,26 @@ def get_sfdx_auth() -> Dict[str, str]:
         print(f"Unexpected error: {e}")
         sys.exit(1)
 
+def get_remaining_page_urls(next_records_url: Optional[str], page_size: int, total_size: int) -> Optional[List[str]]:
+    """Derive the URLs of all remaining result pages from the first nextRecordsUrl
+    
+    Returns None if the URL doesn't have the expected "-<offset>" form, in which
+    case pages have to be followed one nextRecordsUrl at a time.
+    """
+    match = NEXT_RECORDS_URL_PATTERN.match(next_records_url or "")
+    if not match or page_size <= 0 or int(match.group(2)) != page_size:
+        return None
+    return [f"{match.group(1)}{offset}" for offset in range(page_size, total_size, page_size)]
+
 def query_tooling_api(auth: Dict[str, str], query: str) -> List[Dict[str, Any]]:
-    """Execute a SOQL query against the Tooling API with pagination handling"""
-    headers = {
-        "Authorization": f"Bearer {auth['access_token']}",
-        "Content-Type": "application/json"
-    }
+    """Execute a SOQL query against the Tooling API with pagination handling
+    
+    After the first page, the remaining pages are fetched concurrently when
+    their URLs can be derived from the query locator. If a derived page fails or
+    they don't add up to the whole result, pages are followed one
+    nextRecordsUrl at a time instead.
+    """
+    session = create_session(auth)
     
     url = f"{auth['instance_url']}/services/data/v53.0/tooling/query"
     params = {"q": query}
@@ -64,7 +127,7 @@ def query_tooling_api(auth: Dict[str, str], query: str) -> List[Dict[str, Any]]:
     
     try:
         # Initial request
-        response = requests.get(url, headers=headers, params=params)
+        response = session.get(url, params=params)
         
         # Print response details for debugging
         print(f"Response status: {response.status_code}")
@@ -73,23 +136,52 @@ def query_tooling_api(auth: Dict[str, str], query: str) -> List[Dict[str, Any]]:
             
         response.raise_for_status()
         
-        result = response.json()
+        result = loads_json(response.content)
         all_records.extend(result.get("records", []))
         
         # Handle pagination if needed
         next_records_url = result.get("nextRecordsUrl")
+        page_urls = get_remaining_page_urls(next_records_url, len(all_records), result.get("totalSize", 0))
+        if next_records_url and page_urls:
+            def fetch_page(page_url: str) -> Dict[str, Any]:
+                page_response = session.get(f"{auth['instance_url']}{page_url}")
+                page_response.raise_for_status()
+                return loads_json(page_response.content)
+            
+            first_page = list(all_records)
+            try:
+                with ThreadPoolExecutor(max_workers=MAX_METADATA_WORKERS) as executor:
+                    # map keeps pages in order
+                    pages = list(executor.map(fetch_page, page_urls))
+            except (requests.RequestException, json.JSONDecodeError) as e:
+                # e.g. the org rejected a derived locator (INVALID_QUERY_LOCATOR)
+                print(f"Concurrent page request failed: {e}")
+                pages = None
+            
+            if pages is not None:
+                for page in pages:
+                    all_records.extend(page.get("records", []))
+                
+                # Derived URLs are only trusted if they returned exactly the whole result
+                if len(all_records) == result.get("totalSize", 0) and pages[-1].get("done", False):
+                    return all_records
+                print("Concurrent pages did not add up to the query result")
+            
+            print("Following nextRecordsUrl one page at a time instead")
+            all_records = first_page
+        
         while next_records_url:
             next_url = f"{auth['instance_url']}{next_records_url}"
-            response = requests.get(next_url, headers=headers)
+            response = session.get(next_url)
             response.raise_for_status()
             
-            result = response.json()
+            result = loads_json(response.content)
             all_records.extend(result.get("records", []))
             next_records_url = result.get("nextRecordsUrl")
         
         return all_records
     
-    except requests.RequestException as e:
+    except (requests.RequestException, json.JSONDecodeError) as e:
         print(f"API request failed: {e}")
         print(f"Response details (if available): {getattr(e.response, 'text', 'No response text')}")
         sys.exit(1)
@@ -133,25 +225,74 @@ def get_active_flow_versions(auth: Dict[str, str], flow_def_ids: List[str]) -> L
     print(f"Found {len(results)} active flow versions")
     return results
 
-def get_flow_metadata(auth: Dict[str, str], flow_id: str) -> Optional[Dict[str, Any]]:
-    """Get the metadata for a specific flow"""
-    headers = {
+def create_session(auth: Dict[str, str]) -> requests.Session:
+    """Create a keep-alive session sized for the metadata worker pool"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_METADATA_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
         "Authorization": f"Bearer {auth['access_token']}",
         "Content-Type": "application/json"
-    }
-    
+    })
+    return session
+
+def get_flow_metadata(session: requests.Session, auth: Dict[str, str], flow_id: str) -> Optional[Dict[str, Any]]:
+    """Get the metadata for a specific flow"""
     # Use the tooling API to retrieve the flow definition document
     url = f"{auth['instance_url']}/services/data/v53.0/tooling/sobjects/Flow/{flow_id}"
     
     try:
         print(f"Retrieving metadata for flow: {flow_id}")
-        response = requests.get(url, headers=headers)
+        response = session.get(url)
         response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
+        return loads_json(response.content)
+    except (requests.RequestException, json.JSONDecodeError) as e:
         print(f"Error retrieving flow metadata: {e}")
         return None
 
+async def get_flow_metadata_async(client: "httpx.AsyncClient", semaphore: asyncio.Semaphore,
+                                  auth: Dict[str, str], flow_id: str) -> Optional[Dict[str, Any]]:
+    """Get the metadata for a specific flow, capped by the shared semaphore"""
+    url = f"{auth['instance_url']}/services/data/v53.0/tooling/sobjects/Flow/{flow_id}"
+    
+    async with semaphore:
+        try:
+            print(f"Retrieving metadata for flow: {flow_id}")
+            response = await client.get(url)
+            response.raise_for_status()
+            return loads_json(response.content)
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            print(f"Error retrieving flow metadata: {e}")
+            return None
+
+async def fetch_flow_metadata_async(auth: Dict[str, str], flow_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Fetch metadata for all flows on one event loop with httpx"""
+    headers = {
+        "Authorization": f"Bearer {auth['access_token']}",
+        "Content-Type": "application/json"
+    }
+    limits = httpx.Limits(max_connections=MAX_METADATA_WORKERS, max_keepalive_connections=MAX_METADATA_WORKERS)
+    semaphore = asyncio.Semaphore(MAX_METADATA_WORKERS)
+    
+    async with httpx.AsyncClient(headers=headers, limits=limits, http2=HAS_H2) as client:
+        # gather keeps results in flow order
+        return await asyncio.gather(
+            *(get_flow_metadata_async(client, semaphore, auth, flow_id) for flow_id in flow_ids)
+        )
+
+def fetch_all_flow_metadata(auth: Dict[str, str], flow_versions: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+    """Fetch metadata for every flow version, using async httpx if available"""
+    flow_ids = [flow.get("Id") for flow in flow_versions]
+    
+    if HAS_HTTPX:
+        return asyncio.run(fetch_flow_metadata_async(auth, flow_ids))
+    
+    # Fall back to a thread pool over one keep-alive requests session
+    session = create_session(auth)
+    with ThreadPoolExecutor(max_workers=MAX_METADATA_WORKERS) as executor:
+        return list(executor.map(lambda flow_id: get_flow_metadata(session, auth, flow_id), flow_ids))
+
 def save_flow_metadata(flow_metadata: Dict[str, Any], flows_dir: str) -> None:
     """Save the flow metadata to an XML file in the flows directory"""
     if "Metadata" not in flow_metadata:
@@ -168,7 +309,7 @@ def save_flow_metadata(flow_metadata: Dict[str, Any], flows_dir: str) -> None:
     # Save the metadata to a file
     filename = os.path.join(flows_dir, f"{flow_name}.json")
     with open(filename, "w") as f:
-        json.dump(metadata, f, indent=2)
+        f.write(dumps_json(metadata))
     
     print(f"Saved metadata for flow {flow_name} to {filename}")
 
@@ -186,7 +327,7 @@ def main():
     # Save the initial results
     output_file = "opportunity_flows.json"
     with open(output_file, 'w') as f:
-        json.dump(flow_versions, f, indent=2)
+        f.write(dumps_json(flow_versions))
     print(f"Basic flow information saved to {output_file}")
     
     # Create a directory to store flow metadata
@@ -197,10 +338,9 @@ def main():
     
     # For each flow, get its metadata and save it
     print(f"Retrieving detailed metadata for {len(flow_versions)} flows...")
-    for flow in flow_versions:
-        flow_id = flow.get("Id")
-        # Get the detailed metadata for this flow
-        detailed_metadata = get_flow_metadata(auth, flow_id)
+    all_metadata = fetch_all_flow_metadata(auth, flow_versions)
+    
+    for detailed_metadata in all_metadata:
         if detailed_metadata:
             # Save the flow metadata to a file
             save_flow_metadata(detailed_metadata, flows_dir)
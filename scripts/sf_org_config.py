@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+import json
+import os
+
+# Environment variables that override the configured target org, newest CLI first
+TARGET_ORG_ENV_VARS = ["SF_TARGET_ORG", "SFDX_DEFAULTUSERNAME"]
+
+# Project/global config files and the key holding the target org, sf CLI first
+CONFIG_FILES = [
+    (os.path.join('.sf', 'config.json'), 'target-org'),
+    (os.path.join('.sfdx', 'sfdx-config.json'), 'defaultusername')
+]
+
+# Alias files mapping aliases to usernames, sf CLI first
+ALIAS_FILES = [
+    os.path.join('.sf', 'alias.json'),
+    os.path.join('.sfdx', 'alias.json')
+]
+
+def _read_json(path):
+    """Load a JSON file, or None if it is missing or unreadable"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def get_target_org():
+    """Return the org (alias or username) the CLI targets by default, or None
+    
+    Resolved the way the CLI does it, without starting it: environment
+    variables first, then the project config of the current directory or its
+    nearest parent that has one, then the global config in the home directory.
+    """
+    for env_var in TARGET_ORG_ENV_VARS:
+        if os.environ.get(env_var):
+            return os.environ[env_var]
+    
+    home_dir = os.path.expanduser("~")
+    base_dir = os.getcwd()
+    while True:
+        for config_file, key in CONFIG_FILES:
+            value = (_read_json(os.path.join(base_dir, config_file)) or {}).get(key)
+            if value:
+                return value
+        parent_dir = os.path.dirname(base_dir)
+        if parent_dir == base_dir:
+            break
+        base_dir = parent_dir
+    
+    # The home directory is not a parent of the current directory
+    for config_file, key in CONFIG_FILES:
+        value = (_read_json(os.path.join(home_dir, config_file)) or {}).get(key)
+        if value:
+            return value
+    return None
+
+def get_target_org_username():
+    """Return the username of the CLI's default org, or None if it can't be resolved
+    
+    Aliases are looked up in the CLI's alias files. Callers use this to find
+    per-org data saved by earlier runs, so anything ambiguous resolves to None
+    rather than to a guess.
+    """
+    target_org = get_target_org()
+    if not target_org:
+        return None
+    
+    home_dir = os.path.expanduser("~")
+    for alias_file in ALIAS_FILES:
+        username = ((_read_json(os.path.join(home_dir, alias_file)) or {}).get('orgs') or {}).get(target_org)
+        if username:
+            return username
+    
+    # Usernames have the form of an email address; anything else is an unknown alias
+    return target_org if '@' in target_org else None
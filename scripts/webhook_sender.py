@@ -1,10 +1,21 @@
 #!/usr/bin/env python3
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import gzip
 import json
 import logging
+import os
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+# Try to import orjson - we'll use it to parse and write large JSON payloads if available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Configure logging
 logging.basicConfig(
@@ -16,12 +27,42 @@ logger = logging.getLogger(__name__)
 # Webhook configuration
 WEBHOOK_URL = "https://3a3ae7d8-9ac1-49b7-9b0d-bd321e1c56c3.trayapp.io"
 
-def send_to_webhook(data: Dict[str, Any], source: Optional[str] = None) -> bool:
+# Block size for reading JSON files that are streamed to the webhook
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Shared HTTP session so webhook posts reuse one keep-alive TLS connection,
+# retrying transient connection failures and 5xx responses with backoff
+_session = requests.Session()
+_session.headers.update({'Content-Type': 'application/json'})
+_session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                                       max_retries=Retry(total=3, backoff_factor=0.5,
+                                                         status_forcelist=(500, 502, 503, 504),
+                                                         allowed_methods=frozenset({'POST'}),
+                                                         raise_on_status=False)))
+
+def loads_json(data):
+    """Parse a JSON str or bytes payload, using orjson if available
+    
+    orjson's decode errors subclass json.JSONDecodeError, so callers can catch
+    that either way.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps_json_bytes(data):
+    """Serialize data as compact JSON bytes, using orjson if available"""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+def send_to_webhook(data: Dict[str, Any], source: Optional[str] = None, compress: bool = False) -> bool:
     """Send JSON data to the configured webhook.
     
     Args:
         data: Dictionary containing the data to send
         source: Optional identifier for the source of the data (e.g., 'attribution_audit')
+        compress: If True, gzip the request body and send it with Content-Encoding: gzip
         
     Returns:
         bool: True if successful, False otherwise
@@ -31,12 +72,32 @@ def send_to_webhook(data: Dict[str, Any], source: Optional[str] = None) -> bool:
         if source:
             data['webhook_source'] = source
             
+        body = dumps_json_bytes(data)
+        headers = None
+        if compress:
+            body = gzip.compress(body)
+            headers = {'Content-Encoding': 'gzip'}
+            
+    except Exception as e:
+        logger.error(f"Error sending data to webhook: {str(e)}")
+        return False
+        
+    return _post_to_webhook(body, source, headers)
+
+def _post_to_webhook(body: Any, source: Optional[str] = None, headers: Optional[Dict[str, str]] = None) -> bool:
+    """POST an encoded body (bytes or a file-like object) to the webhook.
+    
+    Args:
+        body: Request body; file-like bodies are streamed in blocks
+        source: Optional identifier for the source of the data, for logging
+        headers: Optional extra request headers
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
         # Send POST request to webhook
-        response = requests.post(
-            WEBHOOK_URL,
-            json=data,
-            headers={'Content-Type': 'application/json'}
-        )
+        response = _session.post(WEBHOOK_URL, data=body, headers=headers)
         
         # Check response
         if response.status_code == 200:
@@ -51,9 +112,88 @@ def send_to_webhook(data: Dict[str, Any], source: Optional[str] = None) -> bool:
         logger.error(f"Error sending data to webhook: {str(e)}")
         return False
 
+class SourceTaggedJsonBody:
+    """File-like request body that streams a JSON object file with webhook_source added.
+    
+    The file is read up to its closing brace, then the webhook_source key and
+    the brace are emitted, so the whole file is never held in memory. tell()
+    and seek() let urllib3 rewind the body when it retries a request.
+    """
+    
+    def __init__(self, f, object_end: int, is_empty: bool, source: str):
+        self._file = f
+        self._object_end = object_end
+        separator = b'' if is_empty else b','
+        self._suffix = separator + b'"webhook_source":' + dumps_json_bytes(source) + b'}'
+        self._position = 0
+        
+    def __len__(self) -> int:
+        return self._object_end + len(self._suffix)
+        
+    def tell(self) -> int:
+        return self._position
+        
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self)
+        self._position = offset
+        return offset
+        
+    def read(self, size: Optional[int] = -1) -> bytes:
+        remaining = len(self) - self._position
+        if size is None or size < 0 or size > remaining:
+            size = max(remaining, 0)
+            
+        chunk = b''
+        if self._position < self._object_end:
+            self._file.seek(self._position)
+            chunk = self._file.read(min(size, self._object_end - self._position))
+        if len(chunk) < size:
+            offset = self._position + len(chunk) - self._object_end
+            chunk += self._suffix[offset:offset + size - len(chunk)]
+            
+        self._position += len(chunk)
+        return chunk
+
+def _json_bounds(f) -> Dict[str, Any]:
+    """Find the first and last non-whitespace bytes of a JSON file without reading all of it.
+    
+    Returns:
+        Dictionary with 'first' and 'last' bytes, the 'last_position' offset,
+        and 'is_empty_object' for a top-level {}
+    """
+    head = f.read(STREAM_CHUNK_SIZE).lstrip()
+    first = head[:1]
+    
+    # Scan backwards from the end for the last non-whitespace byte
+    f.seek(0, os.SEEK_END)
+    end = f.tell()
+    last, last_position = b'', -1
+    while end > 0:
+        step = min(STREAM_CHUNK_SIZE, end)
+        f.seek(end - step)
+        block = f.read(step).rstrip()
+        if block:
+            last, last_position = block[-1:], end - step + len(block) - 1
+            break
+        end -= step
+        
+    f.seek(0)
+    return {
+        'first': first,
+        'last': last,
+        'last_position': last_position,
+        'is_empty_object': first == b'{' and head[1:].lstrip()[:1] == b'}'
+    }
+
 def send_json_file(file_path: str, source: Optional[str] = None) -> bool:
     """Send contents of a JSON file to the webhook.
     
+    The file is streamed from disk rather than loaded into memory, so only its
+    outer brackets are checked before sending.
+    
     Args:
         file_path: Path to the JSON file
         source: Optional identifier for the source of the data
@@ -62,19 +202,61 @@ def send_json_file(file_path: str, source: Optional[str] = None) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        return send_to_webhook(data, source)
+        with open(file_path, 'rb') as f:
+            bounds = _json_bounds(f)
+            if (bounds['first'], bounds['last']) not in ((b'{', b'}'), (b'[', b']')):
+                logger.error(f"Invalid JSON in file: {file_path}")
+                return False
+                
+            body = f
+            if source:
+                if bounds['first'] != b'{':
+                    logger.error(f"Cannot add webhook_source to a JSON array in file: {file_path}")
+                    return False
+                body = SourceTaggedJsonBody(f, bounds['last_position'], bounds['is_empty_object'], source)
+                
+            return _post_to_webhook(body, source)
     except FileNotFoundError:
         logger.error(f"File not found: {file_path}")
         return False
-    except json.JSONDecodeError:
-        logger.error(f"Invalid JSON in file: {file_path}")
-        return False
     except Exception as e:
         logger.error(f"Error reading file: {str(e)}")
         return False
 
+def send_json_files(file_paths: List[str], source: Optional[str] = None) -> bool:
+    """Send the contents of several JSON files to the webhook in one gzipped request.
+    
+    The files are sent as {"batch": [...]} in the given order. Nothing is sent
+    if any file can't be read.
+    
+    Args:
+        file_paths: Paths to the JSON files
+        source: Optional identifier for the source of the data
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if not file_paths:
+        logger.warning("No files to send")
+        return False
+        
+    batch = []
+    for file_path in file_paths:
+        try:
+            with open(file_path, 'rb') as f:
+                batch.append(loads_json(f.read()))
+        except FileNotFoundError:
+            logger.error(f"File not found: {file_path}")
+            return False
+        except json.JSONDecodeError:
+            logger.error(f"Invalid JSON in file: {file_path}")
+            return False
+        except Exception as e:
+            logger.error(f"Error reading file: {str(e)}")
+            return False
+            
+    return send_to_webhook({'batch': batch}, source, compress=True)
+
 if __name__ == '__main__':
     if len(sys.argv) > 1:
         # If file path provided as argument, send that file